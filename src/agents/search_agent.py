@@ -3,6 +3,7 @@ from typing import Any, Dict, List
 
 from src.services.duckduckgo_service import DuckDuckGoService
 from src.services.google_search_service import GoogleSearchService
+from src.services.search_result import SearchResult
 from src.services.tavily_service import TavilyService
 
 
@@ -16,7 +17,7 @@ class SearchAgent:
         self.google_service = GoogleSearchService()
         self.tavily_service = TavilyService()
 
-    def search_travel_info(self, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+    def search_travel_info(self, query: str, max_results: int = 5) -> List[SearchResult]:
         """
         다양한 검색 서비스를 통해 여행 정보 수집
 
@@ -25,23 +26,23 @@ class SearchAgent:
             max_results (int): 최대 검색 결과 수
 
         Returns:
-            List[Dict[str, Any]]: 수집된 여행 정보 목록
+            List[SearchResult]: 수집된 여행 정보 목록
         """
         self.logger.info(f"여행 정보 검색 시작: {query}")
 
         search_results = []
 
         # DuckDuckGo 검색
-        duckduckgo_results = self.duckduckgo_service.search(query, max_results)
-        search_results.extend(duckduckgo_results)
+        duckduckgo_results = self.duckduckgo_service.search_web(query, max_results)
+        search_results.extend(duckduckgo_results.get('results', []))
 
         # Google 검색
-        google_results = self.google_service.search(query, max_results)
-        search_results.extend(google_results)
+        google_results = self.google_service.search_web(query, max_results)
+        search_results.extend(google_results.get('results', []))
 
         # Tavily 검색 (AI 기반 검색)
-        tavily_results = self.tavily_service.search(query, max_results)
-        search_results.extend(tavily_results)
+        tavily_results = self.tavily_service.search_web(query, max_results)
+        search_results.extend(tavily_results.get('results', []))
 
         # 중복 제거 및 정제
         unique_results = self._deduplicate_results(search_results)
@@ -49,32 +50,32 @@ class SearchAgent:
         self.logger.info(f"총 {len(unique_results)}개의 여행 정보 수집 완료")
         return unique_results
 
-    def _deduplicate_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _deduplicate_results(self, results: List[SearchResult]) -> List[SearchResult]:
         """
         검색 결과 중복 제거 및 정제
 
         Args:
-            results (List[Dict[str, Any]]): 원본 검색 결과
+            results (List[SearchResult]): 원본 검색 결과
 
         Returns:
-            List[Dict[str, Any]]: 중복 제거된 검색 결과
+            List[SearchResult]: 중복 제거된 검색 결과
         """
         unique_results = []
         seen_urls = set()
 
         for result in results:
-            if result.get('link') not in seen_urls:
+            if result.url not in seen_urls:
                 unique_results.append(result)
-                seen_urls.add(result.get('link'))
+                seen_urls.add(result.url)
 
         return unique_results
 
-    def extract_travel_details(self, search_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def extract_travel_details(self, search_results: List[SearchResult]) -> Dict[str, Any]:
         """
         검색 결과에서 여행 관련 상세 정보 추출
 
         Args:
-            search_results (List[Dict[str, Any]]): 검색 결과 목록
+            search_results (List[SearchResult]): 검색 결과 목록
 
         Returns:
             Dict[str, Any]: 추출된 여행 상세 정보
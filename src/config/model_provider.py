@@ -11,13 +11,19 @@ llm = get_llm_for_agent("planner_agent")
 import yaml
 from langchain_openai import ChatOpenAI
 
+# libyaml C 바인딩이 있으면 C 로더를 사용합니다.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # from langchain_google_genai import ChatGoogleGenerativeAI # 향후 확장
 
 
 def load_model_config():
     """models.yml 파일을 로드합니다."""
     with open("src/config/models.yml", 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
 
 
 def get_llm_for_agent(agent_name: str):
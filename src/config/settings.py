@@ -49,6 +49,8 @@ class Settings(BaseSettings):
     agent_temperature: float = 0.0
     max_search_results: int = 5
     search_timeout: int = 10
+    # 비슷한 검색어 결과 재사용 (검색마다 임베딩 API를 호출하므로 기본은 꺼 둡니다)
+    semantic_search_cache: bool = False
 
     # Streamlit UI Configuration
     page_title: str = "🌍 AI 여행 플래너"
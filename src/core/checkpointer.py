@@ -0,0 +1,127 @@
+# 워크플로우 종료 시점에만 체크포인트를 저장하는 체크포인터
+
+import threading
+import time
+from collections import OrderedDict
+
+from langgraph.checkpoint.memory import MemorySaver
+
+# 메모리에 보관할 최대 대화 스레드 수 (초과하면 가장 오래 사용하지 않은 스레드부터 삭제)
+MAX_THREADS = 256
+# 이 시간(초) 동안 사용하지 않은 대화 스레드는 삭제합니다.
+THREAD_IDLE_TTL = 6 * 60 * 60
+
+
+class FinalStateMemorySaver(MemorySaver):
+    """
+    super-step마다 저장하지 않고, 실행이 끝났을 때 마지막 상태만 저장하는 MemorySaver.
+
+    한 턴 안에서 중간 복구가 필요하지 않으므로, 실행 중에는 스레드별 최신 체크포인트만
+    버퍼에 보관하고 finalize() 호출 시 한 번에 기록합니다.
+    서브그래프(checkpoint_ns가 "supervisor:<task_id>" 등)의 체크포인트는 작업마다 새 네임스페이스라
+    다시 읽히지 않으므로 저장하지 않습니다.
+    """
+
+    def __init__(self, *args, max_threads: int = MAX_THREADS,
+                 idle_ttl: float = THREAD_IDLE_TTL, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        # 모든 세션이 하나의 체크포인터를 공유하므로, 스레드별 마지막 사용 시각으로 오래된 대화를 정리합니다.
+        self.max_threads = max_threads
+        self.idle_ttl = idle_ttl
+        self._last_used: "OrderedDict[str, float]" = OrderedDict()
+
+    def get_tuple(self, config):
+        # 서브그래프 네임스페이스는 저장하지 않으므로, 조회로 빈 항목이 생기지 않게 바로 반환합니다.
+        if config["configurable"].get("checkpoint_ns", ""):
+            return None
+        return super().get_tuple(config)
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        result = {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+        if checkpoint_ns:
+            return result
+
+        with self._pending_lock:
+            pending = self._pending.get(thread_id)
+            # 중간 단계에서 바뀐 채널도 마지막 체크포인트와 함께 저장되도록 누적합니다.
+            changed = set(new_versions)
+            if pending:
+                changed |= pending["changed"]
+            self._pending[thread_id] = {
+                "config": config,
+                "checkpoint": checkpoint,
+                "metadata": metadata,
+                "changed": changed,
+                "writes": [],
+            }
+
+        return result
+
+    def put_writes(self, config, writes, task_id, task_path=""):
+        configurable = config["configurable"]
+        if configurable.get("checkpoint_ns", ""):
+            return
+
+        with self._pending_lock:
+            pending = self._pending.get(configurable["thread_id"])
+            if pending and pending["checkpoint"]["id"] == configurable.get("checkpoint_id"):
+                pending["writes"].append((config, writes, task_id, task_path))
+                return
+
+        super().put_writes(config, writes, task_id, task_path)
+
+    def finalize(self, thread_id: str) -> None:
+        """버퍼에 남아 있는 해당 스레드의 마지막 체크포인트를 저장합니다."""
+        with self._pending_lock:
+            pending = self._pending.pop(thread_id, None)
+
+        if pending:
+            checkpoint = pending["checkpoint"]
+            channel_versions = checkpoint["channel_versions"]
+            new_versions = {
+                channel: channel_versions[channel]
+                for channel in pending["changed"]
+                if channel in channel_versions
+            }
+            super().put(pending["config"], checkpoint,
+                        pending["metadata"], new_versions)
+            for config, writes, task_id, task_path in pending["writes"]:
+                super().put_writes(config, writes, task_id, task_path)
+
+        self._evict_idle_threads(thread_id)
+
+    def _evict_idle_threads(self, thread_id: str) -> None:
+        """방금 사용한 스레드를 기록하고, 오래 쓰지 않았거나 개수를 넘긴 스레드를 삭제합니다."""
+        now = time.monotonic()
+        expired = []
+        with self._pending_lock:
+            self._last_used[thread_id] = now
+            self._last_used.move_to_end(thread_id)
+            while self._last_used:
+                oldest, last_used = next(iter(self._last_used.items()))
+                if (len(self._last_used) <= self.max_threads
+                        and now - last_used < self.idle_ttl):
+                    break
+                del self._last_used[oldest]
+                expired.append(oldest)
+
+        for oldest in expired:
+            super().delete_thread(oldest)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """스레드의 체크포인트와 아직 저장하지 않은 버퍼를 모두 삭제합니다."""
+        with self._pending_lock:
+            self._pending.pop(thread_id, None)
+            self._last_used.pop(thread_id, None)
+        super().delete_thread(thread_id)
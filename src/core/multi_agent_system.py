@@ -1,15 +1,17 @@
 # LangGraph를 이용한 여행 계획 멀티 에이전트 시스템
 
-from typing import Annotated
+from typing import Annotated, Literal
 
-from langchain_core.messages import HumanMessage
-from langchain_core.tools import InjectedToolCallId, tool
+import httpx
+from langchain_core.messages import (AIMessage, AIMessageChunk, HumanMessage,
+                                     ToolMessage)
+from langchain_core.tools import tool
 from langchain_openai import ChatOpenAI
-from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, START, MessagesState, StateGraph
 from langgraph.prebuilt import InjectedState, create_react_agent
-from langgraph.types import Command
+from langgraph.types import Command, Send
 
+from src.core.checkpointer import FinalStateMemorySaver
 from src.prompts.agent_prompts import AgentPrompts
 from src.tools.calendar_tools import (add_travel_plan_to_calendar,
                                       check_calendar_availability,
@@ -17,36 +19,66 @@ from src.tools.calendar_tools import (add_travel_plan_to_calendar,
                                       search_travel_plan_tool,
                                       update_travel_plan_tool)
 from src.tools.planner_tools import web_search_tool
-from src.tools.search_tools import location_search_tool, nearby_search_tool
+from src.tools.search_tools import location_search_batch_tool, nearby_search_tool
 from src.tools.share_tools import create_notion_page_tool
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+HANDOFF_TOOL_NAME = "transfer_to_agent"
 
-def create_handoff_tool(*, agent_name: str, description: str | None = None):
+# handoff 대상 Worker 에이전트와 각 에이전트에게 맡길 작업 설명
+WORKER_DESCRIPTIONS = {
+    "planner_agent": "여행 계획 초안을 만들거나 최종 계획을 완성합니다.",
+    "location_search_agent": "계획에 필요한 장소의 상세 정보를 찾아옵니다.",
+    "calendar_agent": "완성된 여행 계획을 카카오 캘린더에 등록합니다.",
+    "share_agent": "완성된 여행 계획을 노션에 공유하고 캘린더 등록 여부를 확인합니다.",
+}
+
+# 모든 에이전트가 공유하는 LLM 클라이언트의 HTTP 연결 풀 설정
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+
+def _handoff_messages(message: AIMessage) -> list[ToolMessage]:
+    """AIMessage의 모든 handoff 호출에 대한 응답 메시지를 만듭니다.
+
+    동시에 실행되는 Worker들이 같은 ID의 메시지를 돌려주므로, 부모 상태에서는 한 번씩만 병합됩니다.
+    """
+    return [
+        ToolMessage(
+            content=f"Successfully transferred to {tool_call['args']['agent']}",
+            name=HANDOFF_TOOL_NAME,
+            tool_call_id=tool_call["id"],
+            id=f"handoff-{tool_call['id']}",
+        )
+        for tool_call in message.tool_calls
+        if tool_call["name"] == HANDOFF_TOOL_NAME
+    ]
+
+
+def create_handoff_tool(*, agent_descriptions: dict[str, str]):
     """
-    특정 에이전트에게 제어권을 넘겨주는 handoff 도구를 생성합니다.
-    이 도구를 호출하면, 그래프는 지정된 에이전트로 이동합니다.
+    지정한 에이전트에게 제어권을 넘겨주는 단일 handoff 도구를 생성합니다.
+    `agent` 인자로 대상 에이전트를 받으며, 호출 시 그래프는 해당 에이전트로 이동합니다.
+    에이전트마다 도구를 따로 만들지 않으므로 Supervisor에게 전달되는 도구 스키마가 하나로 줄어듭니다.
     """
-    name = f"transfer_to_{agent_name}"
-    description = description or f"Ask {agent_name} for help."
+    AgentName = Literal[tuple(agent_descriptions)]
+    description = "작업을 할당할 에이전트에게 제어권을 넘깁니다.\n" + "\n".join(
+        f"- {name}: {desc}" for name, desc in agent_descriptions.items()
+    )
 
-    @tool(name, description=description)
+    @tool(HANDOFF_TOOL_NAME, description=description)
     def handoff_tool(
+        agent: AgentName,
         state: Annotated[MessagesState, InjectedState],
-        tool_call_id: Annotated[str, InjectedToolCallId],
     ) -> Command:
-        tool_message = {
-            "role": "tool",
-            "content": f"Successfully transferred to {agent_name}",
-            "name": name,
-            "tool_call_id": tool_call_id,
-        }
-        # Command.PARENT를 사용하여 부모 그래프(supervisor)의 상태를 업데이트하고 이동합니다.
+        # Send로 이동하는 부모 Command는 ToolNode가 하나로 합쳐 주므로,
+        # 한 번에 여러 에이전트를 호출하면 각 Worker가 동시에 실행됩니다.
+        # Worker의 대화 기록이 유효하도록 모든 handoff 호출의 응답 메시지를 함께 전달합니다.
+        messages = state["messages"]
         return Command(
-            goto=agent_name,
-            update={**state, "messages": state["messages"] + [tool_message]},
+            goto=[Send(agent, {"messages": messages + _handoff_messages(messages[-1])})],
             graph=Command.PARENT,
         )
 
@@ -55,155 +87,124 @@ def create_handoff_tool(*, agent_name: str, description: str | None = None):
 
 class TravelMultiAgentSystem:
     def __init__(self, model_name: str = "gpt-4o-mini"):
-        self.llm = ChatOpenAI(model=model_name, temperature=0)
+        # 하나의 ChatOpenAI 인스턴스를 모든 에이전트가 공유하며, keep-alive 연결을 재사용합니다.
+        self.llm = ChatOpenAI(
+            model=model_name,
+            temperature=0,
+            max_retries=2,
+            http_client=httpx.Client(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT),
+            http_async_client=httpx.AsyncClient(
+                limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT),
+        )
+        self.checkpointer = FinalStateMemorySaver()
         self.app = None
 
-    def _get_agent_name(self, messages: list) -> str | None:
-        """메시지에서 라우팅할 에이전트 이름을 가져옵니다."""
-        last_message = messages[-1]
-        # ToolMessage에는 tool_calls 속성이 없으므로, 확인 후 접근해야 합니다.
-        if hasattr(last_message, "tool_calls") and last_message.tool_calls:
-            tool_name = last_message.tool_calls[0]['name']
-            if tool_name.startswith("transfer_to_"):
-                return tool_name.replace("transfer_to_", "")
-        return None
-
-    def route_to_next_agent(self, state: MessagesState):
-        """다음 에이전트로 라우팅하거나 대화를 종료합니다."""
-        agent_name = self._get_agent_name(state["messages"])
-        if agent_name:
-            # handoff 도구가 호출된 경우 해당 에이전트로 이동
-            return agent_name
-        # Supervisor가 도구를 호출하지 않고 메시지만 생성한 경우, 종료
-        return END
-
-    def _create_planner_agent(self):
-        """더 이상 사용되지 않는 메서드"""
-        pass
-
-    def _create_location_search_agent(self):
-        """더 이상 사용되지 않는 메서드"""
-        pass
-
-    def _create_calendar_agent(self):
-        """더 이상 사용되지 않는 메서드"""
-        pass
-
-    def _create_share_agent(self):
-        """더 이상 사용되지 않는 메서드"""
-        pass
-
     def build_graph(self):
         """Handoff 통신 방식을 사용한 멀티 에이전트 그래프 구성"""
 
         # 1. Handoff 도구 생성
-        assign_to_planner_agent = create_handoff_tool(
-            agent_name="planner_agent",
-            description="여행 계획 초안을 만들거나 최종 계획을 완성하도록 planner_agent에게 작업을 할당합니다.",
-        )
-        assign_to_location_search_agent = create_handoff_tool(
-            agent_name="location_search_agent",
-            description="계획에 필요한 장소의 상세 정보를 찾아오도록 location_search_agent에게 작업을 할당합니다.",
-        )
-        assign_to_calendar_agent = create_handoff_tool(
-            agent_name="calendar_agent",
-            description="완성된 여행 계획을 카카오 캘린더에 등록하도록 calendar_agent에게 작업을 할당합니다.",
-        )
-        assign_to_share_agent = create_handoff_tool(
-            agent_name="share_agent",
-            description="완성된 여행 계획을 노션에 공유하고 캘린더 등록 여부를 확인하도록 share_agent에게 작업을 할당합니다.",
-        )
-
-        # 2. Supervisor 에이전트 생성 (Handoff 도구 사용)
-        supervisor_agent = create_react_agent(
-            model=self.llm,
-            tools=[assign_to_planner_agent,
-                   assign_to_location_search_agent,
-                   assign_to_calendar_agent,
-                   assign_to_share_agent],
-            prompt=AgentPrompts.get_prompt("supervisor"),
-            name="supervisor",
-        )
-
-        # 3. Worker 에이전트 생성
-        planner_agent = create_react_agent(
-            model=self.llm,
-            tools=[web_search_tool],
-            prompt=AgentPrompts.get_prompt("planner_agent"),
-            name="planner_agent"
-        )
-        location_search_agent = create_react_agent(
-            model=self.llm,
-            tools=[location_search_tool, nearby_search_tool],
-            prompt=AgentPrompts.get_prompt("location_search_agent"),
-            name="location_search_agent"
-        )
-        calendar_agent = create_react_agent(
-            model=self.llm,
-            tools=[
+        handoff_tool = create_handoff_tool(
+            agent_descriptions=WORKER_DESCRIPTIONS)
+
+        # 2. Supervisor 및 Worker 에이전트 생성
+        agent_specs = {
+            "supervisor": [handoff_tool],
+            "planner_agent": [web_search_tool],
+            "location_search_agent": [location_search_batch_tool,
+                                      nearby_search_tool],
+            "calendar_agent": [
                 add_travel_plan_to_calendar,
                 check_calendar_availability,
                 update_travel_plan_tool,
                 delete_travel_plan_tool,
                 search_travel_plan_tool
             ],
-            prompt=AgentPrompts.get_prompt("calendar_agent"),
-            name="calendar_agent"
-        )
-        share_agent = create_react_agent(
-            model=self.llm,
-            tools=[create_notion_page_tool],
-            prompt=AgentPrompts.get_prompt("share_agent"),
-            name="share_agent"
-        )
+            "share_agent": [create_notion_page_tool],
+        }
 
-        # 4. 멀티 에이전트 그래프 생성
+        def _create_agent(name: str, tools: list):
+            return create_react_agent(
+                model=self.llm,
+                tools=tools,
+                prompt=AgentPrompts.get_system_message(name),
+                name=name,
+                # v1은 한 번의 ToolNode 실행에서 모든 도구 호출을 처리하므로,
+                # Supervisor의 여러 handoff가 하나의 부모 Command(Send 목록)로 합쳐집니다.
+                version="v1" if name == "supervisor" else "v2",
+            )
+
+        agents = {name: _create_agent(name, tools)
+                  for name, tools in agent_specs.items()}
+
+        # 3. 멀티 에이전트 그래프 생성
         supervisor_graph = StateGraph(MessagesState)
 
-        supervisor_graph.add_node("supervisor", supervisor_agent)
-        supervisor_graph.add_node("planner_agent", planner_agent)
-        supervisor_graph.add_node(
-            "location_search_agent", location_search_agent)
-        supervisor_graph.add_node("calendar_agent", calendar_agent)
-        supervisor_graph.add_node("share_agent", share_agent)
+        # Supervisor는 handoff 도구의 Command로 Worker에게 이동하고,
+        # 도구를 호출하지 않고 답변하면 다음 노드가 없으므로 그래프가 종료됩니다.
+        supervisor_graph.add_node(agents.pop("supervisor"),
+                                  destinations=(*WORKER_DESCRIPTIONS, END))
+        for name, agent in agents.items():
+            supervisor_graph.add_node(name, agent)
 
-        # 5. 에이전트 간의 작업 흐름 정의
+        # 4. 에이전트 간의 작업 흐름 정의
         supervisor_graph.add_edge(START, "supervisor")
 
-        # Supervisor의 출력에 따라 다음 노드를 결정하는 조건부 엣지
-        supervisor_graph.add_conditional_edges(
-            "supervisor",
-            self.route_to_next_agent,
-            {
-                "planner_agent": "planner_agent",
-                "location_search_agent": "location_search_agent",
-                "calendar_agent": "calendar_agent",
-                "share_agent": "share_agent",
-                END: END,
-            },
-        )
-
         # 각 Worker 에이전트는 작업 완료 후 항상 Supervisor에게 제어권을 반환합니다.
-        supervisor_graph.add_edge("planner_agent", "supervisor")
-        supervisor_graph.add_edge("location_search_agent", "supervisor")
-        supervisor_graph.add_edge("calendar_agent", "supervisor")
-        supervisor_graph.add_edge("share_agent", "supervisor")
-
-        # Supervisor는 handoff 도구를 사용하여 다른 노드로 제어권을 넘겨줍니다.
-        # Graph는 END 상태에 도달하거나, Supervisor가 더 이상 도구를 호출하지 않을 때 종료됩니다.
+        for name in WORKER_DESCRIPTIONS:
+            supervisor_graph.add_edge(name, "supervisor")
 
-        self.app = supervisor_graph.compile(checkpointer=MemorySaver())
+        self.app = supervisor_graph.compile(checkpointer=self.checkpointer)
         return self.app
 
-    def stream(self, user_input: str, config: dict = None):
-        """사용자 입력을 받아 멀티 에이전트 시스템을 스트림으로 실행"""
+    def _prepare_run(self, user_input: str, config: dict = None):
+        """그래프를 준비하고 실행 입력과 설정을 반환합니다."""
         if not self.app:
             self.build_graph()
 
         inputs = {"messages": [HumanMessage(content=user_input)]}
         if config is None:
             config = {"configurable": {"thread_id": "travel-chat-handoff"}}
+        return inputs, config
+
+    def stream(self, user_input: str, config: dict = None):
+        """사용자 입력을 받아 멀티 에이전트 시스템을 스트림으로 실행"""
+        inputs, config = self._prepare_run(user_input, config)
 
         # LangGraph 튜토리얼의 'from scratch' 방식에 따라 subgraphs=True 옵션을 사용하지 않습니다.
-        for chunk in self.app.stream(inputs, config):
-            yield chunk
+        try:
+            for chunk in self.app.stream(inputs, config):
+                yield chunk
+        finally:
+            # 워크플로우가 끝난 시점의 상태만 체크포인트로 저장합니다.
+            self.checkpointer.finalize(config["configurable"]["thread_id"])
+
+    def stream_response(self, user_input: str, config: dict = None):
+        """Supervisor의 답변을 토큰 단위로 스트리밍
+
+        (메시지 ID, 텍스트 조각)을 생성합니다. Supervisor가 새 메시지를 시작하면 메시지 ID가 바뀝니다.
+        """
+        inputs, config = self._prepare_run(user_input, config)
+
+        # 각 에이전트는 서브그래프이므로, 그 안의 LLM 토큰을 받으려면 subgraphs=True가 필요합니다.
+        try:
+            for namespace, (message, _) in self.app.stream(
+                    inputs, config, stream_mode="messages", subgraphs=True):
+                if (namespace and namespace[0].startswith("supervisor:")
+                        and isinstance(message, AIMessageChunk) and message.content):
+                    yield message.id, message.content
+        finally:
+            self.checkpointer.finalize(config["configurable"]["thread_id"])
+
+    async def astream(self, user_input: str, config: dict = None):
+        """사용자 입력을 받아 멀티 에이전트 시스템을 비동기 스트림으로 실행
+
+        LLM 호출을 기다리는 동안 이벤트 루프를 점유하지 않으므로,
+        하나의 워커에서 여러 대화를 동시에 처리할 수 있습니다.
+        """
+        inputs, config = self._prepare_run(user_input, config)
+
+        try:
+            async for chunk in self.app.astream(inputs, config, subgraphs=False):
+                yield chunk
+        finally:
+            self.checkpointer.finalize(config["configurable"]["thread_id"])
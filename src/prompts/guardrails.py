@@ -1,11 +1,26 @@
 # guardrails.py에 추가할 새로운 필터
+import hashlib
+from typing import Optional, Tuple
+
+from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
-from openai import ContentFilterFinishReasonError
 
+from src.utils.cache import TTLCache
+
+Verdict = Tuple[bool, Optional[str]]
+
+
+def _content_key(content: str) -> str:
+    """판정 캐시 키로 사용할 내용 해시를 만듭니다."""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class LLMBasedFilter:
+    """LLM으로 내용의 안전성을 판단하는 필터 (네트워크 호출이 필요한 가장 비싼 필터)"""
 
-class LLMBasedFilter(ContentFilterFinishReasonError):
     def __init__(self):
-        super().__init__("llm_semantic_filter")
+        self.name = "llm_semantic_filter"
         # 가드레일 전용으로 빠르고 저렴한 모델 사용
         self.guardrail_llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
         self.prompt = ChatPromptTemplate.from_template(
@@ -21,10 +36,20 @@ class LLMBasedFilter(ContentFilterFinishReasonError):
             내용: {content}
             """
         )
+        self.chain = self.prompt | self.guardrail_llm | JsonOutputParser()
+        # 같은 내용에 대한 판정은 다시 요청하지 않습니다.
+        self._verdicts = TTLCache(maxsize=1024, ttl=3600)
 
-    def check(self, content: str) -> Tuple[bool, Optional[str]]:
-        chain = self.prompt | self.guardrail_llm | JsonOutputParser()
-        result = chain.invoke({"content": content})
+    @staticmethod
+    def _to_verdict(result: dict) -> Verdict:
         if not result["is_safe"]:
             return False, result["reason"]
         return True, None
+
+    def check(self, content: str) -> Verdict:
+        key = _content_key(content)
+        verdict = self._verdicts.get(key)
+        if verdict is None:
+            verdict = self._to_verdict(self.chain.invoke({"content": content}))
+            self._verdicts.set(key, verdict)
+        return verdict
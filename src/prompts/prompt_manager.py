@@ -1,3 +1,5 @@
+import functools
+import os
 from pathlib import Path
 
 import yaml
@@ -5,16 +7,33 @@ from langchain_core.prompts import (ChatPromptTemplate,
                                     HumanMessagePromptTemplate,
                                     SystemMessagePromptTemplate)
 
+# libyaml C 바인딩이 있으면 C 로더를 사용합니다.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 def load_prompt_template(agent_name: str, version: str = "v1") -> ChatPromptTemplate:
-    """에이전트와 버전에 맞는 프롬프트 템플릿을 로드합니다."""
+    """에이전트와 버전에 맞는 프롬프트 템플릿을 로드합니다.
+
+    한 번 로드한 템플릿은 (agent_name, version) 기준으로 캐싱합니다.
+    개발 중 YAML 수정 사항을 바로 반영하려면 PROMPT_RELOAD 환경 변수를 설정하세요.
+    """
+    if os.getenv("PROMPT_RELOAD"):
+        _load_prompt_template_cached.cache_clear()
+    return _load_prompt_template_cached(agent_name, version)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_prompt_template_cached(agent_name: str, version: str) -> ChatPromptTemplate:
     prompt_path = Path(f"src/prompts/templates/{version}/{agent_name}.yml")
 
     if not prompt_path.exists():
         raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
 
     with open(prompt_path, 'r', encoding='utf-8') as f:
-        prompt_config = yaml.safe_load(f)
+        prompt_config = yaml.load(f, Loader=_YamlLoader)
 
     # ChatPromptTemplate 형식에 맞게 생성
     # 예시: 시스템 프롬프트만 있는 경우
@@ -1,14 +1,24 @@
 import os
 from typing import Any, Dict
 
+import httpx
 from dotenv import load_dotenv
-from googleapiclient.discovery import build
 
+from src.services.search_result import SearchResult
+from src.utils.cache import TTLCache
+from src.utils.json_utils import json_loads
 from src.utils.logger import get_logger
 
 load_dotenv()
 logger = get_logger(__name__)
 
+# Custom Search JSON API 엔드포인트 (discovery 문서 없이 직접 호출)
+SEARCH_URL = "https://customsearch.googleapis.com/customsearch/v1"
+
+# 반복 검색어는 짧은 시간 동안 네트워크 호출 없이 재사용합니다.
+SEARCH_CACHE_TTL = 300
+SEARCH_CACHE_SIZE = 512
+
 
 class GoogleSearchService:
     """Google Custom Search API를 사용하는 서비스 클래스"""
@@ -19,46 +29,65 @@ class GoogleSearchService:
         self.cx = os.getenv("GOOGLE_SEARCH_CX")
         if not self.api_key or not self.cx:
             raise ValueError("Google API 키 또는 CX ID가 .env 파일에 설정되지 않았습니다.")
-        # 서비스 인스턴스는 매번 새로 생성하여 메모리 누수 방지
-
-    def _format_result(self, item: Dict) -> Dict:
+        # keep-alive 연결을 재사용하는 클라이언트 (이벤트 루프에 묶이지 않아 어디서나 사용 가능)
+        self._client = httpx.Client(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+        )
+        self._cache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+
+    def close(self) -> None:
+        """열려 있는 HTTP 연결을 닫습니다."""
+        self._client.close()
+
+    def _format_result(self, item: Dict) -> SearchResult:
         """API 응답 항목을 일관된 형식으로 변환합니다."""
-        return {
-            "title": item.get("title", ""),
-            "url": item.get("link", ""),
-            "description": item.get("snippet", ""),
-        }
+        return SearchResult(
+            item.get("title", ""),
+            item.get("link", ""),
+            item.get("snippet", ""),
+        )
 
     def search_web(self, query: str, num_results: int = 5) -> Dict[str, Any]:
         """
         Google Custom Search API를 사용하여 웹을 검색합니다.
+        discovery 문서로 서비스를 만들지 않고, 공유 클라이언트로 REST 엔드포인트를 직접 호출합니다.
         """
         if not query:
             return self._empty_result(query, "검색어가 비어있습니다.")
 
-        try:
-            # 새로운 서비스 인스턴스를 매번 생성하여 메모리 누수 방지
-            service = build("customsearch", "v1",
-                            developerKey=self.api_key, cache_discovery=False)
+        cache_key = (query, num_results)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-            res = (
-                service.cse()
-                .list(q=query, cx=self.cx, num=num_results)
-                .execute()
-            )
+        params = {
+            "key": self.api_key,
+            "cx": self.cx,
+            "q": query,
+            "num": num_results,
+        }
+
+        try:
+            response = self._client.get(SEARCH_URL, params=params)
+            if response.status_code != 200:
+                logger.error(
+                    f"Google 검색 API 오류: {response.status_code} - {response.text}")
+                return self._empty_result(
+                    query, f"API 오류: {response.status_code}")
+            res = json_loads(response.content)
 
             search_results = [
                 self._format_result(item) for item in res.get("items", [])
             ]
 
-            # 서비스 객체 정리
-            del service
-
-            return {
+            result = {
                 "success": True,
                 "query": query,
                 "results": search_results,
             }
+            self._cache.set(cache_key, result)
+            return result
         except Exception as e:
             logger.error(f"Google 검색 중 예기치 않은 오류: {e}")
             return self._empty_result(query, f"예기치 않은 오류: {e}")
@@ -2,116 +2,268 @@
 KakaoTalk Calendar API 연동 서비스
 """
 import json
+import math
 import os
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
-import pytz
-import requests
+import httpx
 from dotenv import find_dotenv, load_dotenv, set_key
 
 from ..config.api_config import kakao_calendar_config  # 변경 예정
+from ..utils.json_utils import json_dumps, json_loads
 from ..utils.logger import logger
 
+# .env는 모듈 로드 시 한 번만 읽습니다. (토큰 갱신 결과는 인스턴스에 보관)
+load_dotenv(override=True)
+
+# 액세스 토큰은 유효 시간의 절반이 지나면 미리 갱신합니다.
+TOKEN_REFRESH_RATIO = 0.5
+# 응답에 expires_in이 없을 때 사용할 카카오 액세스 토큰 기본 유효 시간 (초)
+DEFAULT_TOKEN_LIFETIME = 21599
+# 리프레시 토큰이 거부(invalid_grant)된 뒤 토큰 갱신을 다시 시도하기까지 기다릴 시간 (초)
+INVALID_GRANT_BACKOFF = 60
+
+# 일정 time 객체의 고정 필드 (호출마다 다시 구성하지 않고 펼쳐서 사용)
+_EVENT_TIME_TEMPLATE = {
+    "time_zone": "Asia/Seoul",  # API 기본값이지만 명시적으로 설정
+    "all_day": False,
+    "lunar": False,
+}
+
+# 토큰 유효성 확인 결과를 재사용할 시간 (초)
+AVAILABILITY_CHECK_TTL = 60
+
+def _iso_utc(dt: datetime) -> str:
+    """UTC datetime을 YYYY-MM-DDTHH:MM:SSZ 형식으로 포맷팅합니다. (strftime 호출 없이 정수 포맷팅)"""
+    return (f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+            f"T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}Z")
+
+
+def _to_kakao_utc(dt: datetime) -> str:
+    """datetime을 카카오 API가 요구하는 UTC 문자열(YYYY-MM-DDTHH:MM:SSZ)로 변환합니다.
+
+    naive datetime은 astimezone이 값마다 로컬 시간대 규칙(일광 절약 시간 포함)으로 해석합니다.
+    """
+    return _iso_utc(dt.astimezone(timezone.utc))
+
+
+def _create_client() -> httpx.Client:
+    """카카오 API 전용 HTTP/2 클라이언트를 생성합니다. (여러 요청이 하나의 연결을 공유)"""
+    transport = httpx.HTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        retries=3,  # 연결 실패 시에만 재시도
+    )
+    return httpx.Client(transport=transport, timeout=30.0)
+
 
 class KakaoCalendarService:
     """KakaoTalk Calendar API 연동 서비스"""
 
-    def __init__(self):
-        # 서비스 초기화 시마다 .env 파일을 강제로 다시 로드하여 캐시 문제를 해결합니다.
-        load_dotenv(override=True)
+    # 갱신한 토큰을 저장할 .env 파일 경로 (파일 시스템 탐색은 한 번만 수행)
+    _TOKEN_FILE = find_dotenv()
+    # 연결 예열은 프로세스에서 처음 생성된 인스턴스만 수행
+    _prewarm_started = False
+    _prewarm_lock = threading.Lock()
+
+    def __init__(self, persist_token: bool = True):
+        """
+        Args:
+            persist_token: 갱신한 토큰을 .env 파일에 저장할지 여부
+                (수명이 짧은 워커는 False로 두어 파일 쓰기를 생략)
+        """
         self.config = kakao_calendar_config  # 변경 예정
+        # 호출마다 다시 만들지 않도록 API URL을 미리 구성합니다.
+        self._token_url = f"{self.config.auth_base_url}/oauth/token"
+        self._token_info_url = f"{self.config.api_base_url}/v1/user/access_token_info"
+        self._events_url = f"{self.config.api_base_url}/v2/api/calendar/events"
+        self._create_url = f"{self.config.api_base_url}/v2/api/calendar/create/event"
+        self._update_url = f"{self.config.api_base_url}/v2/api/calendar/update/event/host"
+        self._delete_url = f"{self.config.api_base_url}/v2/api/calendar/delete/event"
         self.rest_api_key = os.getenv("KAKAO_REST_API_KEY")
         self.refresh_token = os.getenv("KAKAO_REFRESH_TOKEN")
         self.access_token = os.getenv("KAKAO_ACCESS_TOKEN")
-        self.token_file = find_dotenv()
+        self.token_file = self._TOKEN_FILE
+        self.persist_token = persist_token
+        # .env에서 읽은 토큰은 만료 시각을 알 수 없으므로 401 응답 시에만 갱신합니다.
+        self._token_expiry = math.inf if self.access_token else 0.0
+        self._refresh_blocked_until = 0.0
+        # 여러 스레드가 동시에 만료를 감지해도 토큰 갱신은 한 번만 수행합니다.
+        self._token_lock = threading.RLock()
+        self._client = _create_client()
+        # 액세스 토큰이 바뀔 때만 요청 헤더를 다시 만듭니다.
+        self._headers: Optional[Dict[str, str]] = None
+        self._headers_token: Optional[str] = None
+        self._admin_headers: Optional[Dict[str, str]] = None
+        # (토큰 유효 여부, 확인 시각) - check_available 확인 결과 캐시
+        self._availability = (False, -math.inf)
+        self._start_prewarm()
         # self._initialize_service() # 초기화 로직 필요시 구현
 
+    def _start_prewarm(self):
+        """첫 토큰 갱신/API 호출이 TLS 핸드셰이크 비용을 치르지 않도록 연결을 미리 엽니다."""
+        with KakaoCalendarService._prewarm_lock:
+            if KakaoCalendarService._prewarm_started:
+                return
+            KakaoCalendarService._prewarm_started = True
+        threading.Thread(target=self._prewarm_connections,
+                         name="kakao-prewarm", daemon=True).start()
+
+    def _prewarm_connections(self):
+        for url in (self.config.auth_base_url, self.config.api_base_url):
+            try:
+                # 응답 내용과 상태 코드는 중요하지 않으며, 연결이 풀에 남기만 하면 됩니다.
+                self._client.head(url, timeout=2)
+            except httpx.HTTPError as e:
+                logger.debug("카카오 연결 예열 실패 (무시): {}", e)
+
     def _refresh_access_token(self):
         """Refresh Token을 사용하여 새로운 Access Token을 발급받고 .env 파일에 저장합니다."""
-        url = "https://kauth.kakao.com/oauth/token"
+        with self._token_lock:
+            self._refresh_access_token_locked()
+
+    def _refresh_access_token_locked(self):
+        if time.monotonic() < self._refresh_blocked_until:
+            raise Exception("리프레시 토큰이 거부되어 카카오 토큰 갱신을 잠시 중단했습니다.")
+
         data = {
             "grant_type": "refresh_token",
             "client_id": self.rest_api_key,
             "refresh_token": self.refresh_token,
         }
-        response = requests.post(url, data=data)
+        response = self._client.post(self._token_url, data=data)
         if response.status_code != 200:
             logger.error(
                 f"카카오 토큰 갱신 실패: {response.status_code} - {response.text}")
+            if b"invalid_grant" in response.content:
+                # 같은 리프레시 토큰으로는 계속 실패하므로 토큰 엔드포인트 호출을 제한합니다.
+                self._refresh_blocked_until = time.monotonic() + INVALID_GRANT_BACKOFF
             raise Exception("카카오 토큰을 갱신할 수 없습니다.")
 
-        token_info = response.json()
+        token_info = json_loads(response.content)
         self.access_token = token_info["access_token"]
-        set_key(self.token_file, "KAKAO_ACCESS_TOKEN",
-                self.access_token, quote_mode="never")
+        self._token_expiry = (time.monotonic()
+                              + token_info.get("expires_in", DEFAULT_TOKEN_LIFETIME)
+                              * TOKEN_REFRESH_RATIO)
+        if self.persist_token:
+            set_key(self.token_file, "KAKAO_ACCESS_TOKEN",
+                    self.access_token, quote_mode="never")
         logger.info("새로운 카카오 액세스 토큰을 발급하고 저장했습니다.")
 
         # Refresh Token이 갱신된 경우, 함께 저장
         if "refresh_token" in token_info:
             self.refresh_token = token_info["refresh_token"]
-            set_key(self.token_file, "KAKAO_REFRESH_TOKEN",
-                    self.refresh_token, quote_mode="never")
+            if self.persist_token:
+                set_key(self.token_file, "KAKAO_REFRESH_TOKEN",
+                        self.refresh_token, quote_mode="never")
             logger.info("새로운 카카오 리프레시 토큰을 저장했습니다.")
 
-    def _get_headers(self) -> Dict[str, str]:
-        """API 요청 헤더 생성"""
-        if not self.access_token:
-            self._refresh_access_token()
+    def _token_expired(self) -> bool:
+        """액세스 토큰이 없거나 갱신 시점이 지났는지 확인합니다."""
+        return not self.access_token or time.monotonic() >= self._token_expiry
 
-        return {
-            "Authorization": f"Bearer {self.access_token}",
-            # 대부분의 카카오 API는 이 Content-Type을 사용
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
+    def _ensure_token(self):
+        """갱신 시점이 지난 토큰만 갱신합니다. (다른 스레드가 먼저 갱신했다면 생략)"""
+        if self._token_expired():
+            with self._token_lock:
+                if self._token_expired():
+                    self._refresh_access_token_locked()
+
+    def _get_headers(self) -> Dict[str, str]:
+        """API 요청 헤더 생성 (갱신 시점이 지난 토큰은 요청 전에 미리 갱신)"""
+        self._ensure_token()
+
+        if self._headers_token != self.access_token:
+            self._headers = {
+                "Authorization": f"Bearer {self.access_token}",
+                # 대부분의 카카오 API는 이 Content-Type을 사용
+                "Content-Type": "application/x-www-form-urlencoded"
+            }
+            self._headers_token = self.access_token
+        # 호출하는 쪽에서 수정하더라도 캐시된 헤더는 바뀌지 않도록 복사본을 반환
+        return dict(self._headers)
 
     def _get_admin_headers(self) -> Dict[str, str]:
         """API 요청 헤더 생성 (앱 어드민 키 사용)"""
         # TODO: 실제 앱 어드민 키 사용 로직으로 변경
-        app_admin_key = os.getenv("KAKAO_APP_ADMIN_KEY")
-        if not app_admin_key:
-            logger.error("카카오 앱 어드민 키가 설정되지 않았습니다.")
-            raise ValueError("Kakao App Admin Key is not set.")
-        return {
-            "Authorization": f"KakaoAK {app_admin_key}",
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
+        if self._admin_headers is None:
+            app_admin_key = os.getenv("KAKAO_APP_ADMIN_KEY")
+            if not app_admin_key:
+                logger.error("카카오 앱 어드민 키가 설정되지 않았습니다.")
+                raise ValueError("Kakao App Admin Key is not set.")
+            # 어드민 키는 실행 중에 바뀌지 않으므로 한 번 검증한 헤더를 재사용합니다.
+            self._admin_headers = {
+                "Authorization": f"KakaoAK {app_admin_key}",
+                "Content-Type": "application/x-www-form-urlencoded"
+            }
+        return dict(self._admin_headers)
+
+    def check_available(self) -> bool:
+        """토큰 유효성을 확인해 서비스 사용 가능 여부를 반환합니다.
+
+        카카오 API를 호출하므로 결과를 AVAILABILITY_CHECK_TTL초 동안 재사용하며,
+        같은 기간 동안 일정 조회/생성/수정 전의 확인(_known_unavailable)에도 사용됩니다.
+        """
+        valid, checked_at = self._availability
+        now = time.monotonic()
+        if now - checked_at < AVAILABILITY_CHECK_TTL:
+            return valid
+        try:
+            # 만료된 토큰은 _request_with_retry에서 갱신 후 다시 확인합니다.
+            self._request_with_retry("get", self._token_info_url)
+            valid = True
+        except Exception as e:
+            logger.warning(f"카카오 토큰 유효성 확인 실패: {e}")
+            valid = False
+        self._availability = (valid, now)
+        return valid
 
-    def is_available(self) -> bool:
-        """서비스 사용 가능 여부 확인 (기본적으로 True, 필요시 로직 추가)"""
-        # TODO: 실제 서비스 가능 상태 확인 로직 (예: 토큰 유효성 검사)
-        return True
+    def _known_unavailable(self) -> bool:
+        """최근 AVAILABILITY_CHECK_TTL초 안에 확인한 토큰이 유효하지 않았는지 여부 (API 호출 없음)
+
+        기간이 지나면 일시적인 오류였을 수 있으므로 다시 API를 호출해 봅니다.
+        """
+        valid, checked_at = self._availability
+        return not valid and time.monotonic() - checked_at < AVAILABILITY_CHECK_TTL
 
     def _request_with_retry(self, method, url, **kwargs):
-        """API 요청을 보내고, 401 오류 시 토큰을 갱신하여 재시도합니다."""
+        """API 요청을 보내고, 401 오류 시 토큰을 갱신하여 재시도합니다.
+
+        토큰은 _get_headers에서 만료 전에 갱신되므로, 401 재시도는 예외적인 경우의 안전장치입니다.
+        """
         try:
             headers = self._get_headers()
             kwargs["headers"] = headers
-            response = requests.request(method, url, **kwargs)
+            response = self._client.request(method, url, **kwargs)
 
             if response.status_code == 401:
                 logger.warning("카카오 API 접근 토큰이 만료되어 재발급을 시도합니다.")
                 self._refresh_access_token()
                 # 갱신된 토큰으로 헤더 다시 설정
                 kwargs["headers"] = self._get_headers()
-                response = requests.request(method, url, **kwargs)
+                response = self._client.request(method, url, **kwargs)
 
             response.raise_for_status()
             return response
-        except requests.exceptions.RequestException as e:
-            logger.error(
-                f"카카오톡 캘린더 API 오류: {e.response.text if e.response else str(e)}")
+        except httpx.HTTPStatusError as e:
+            logger.error(f"카카오톡 캘린더 API 오류: {e.response.text}")
+            raise
+        except httpx.HTTPError as e:
+            logger.error(f"카카오톡 캘린더 API 오류: {str(e)}")
             raise
 
     def check_token_info(self):
         """현재 액세스 토큰의 정보를 확인하여 스코프를 검사합니다."""
-        url = "https://kapi.kakao.com/v1/user/access_token_info"
         logger.info("현재 토큰 정보 확인을 시도합니다...")
         try:
-            response = self._request_with_retry("get", url)
-            token_info = response.json()
-            logger.info(
-                f"토큰 정보: {json.dumps(token_info, indent=2, ensure_ascii=False)}")
+            response = self._request_with_retry("get", self._token_info_url)
+            token_info = json_loads(response.content)
+            logger.opt(lazy=True).debug(
+                "토큰 정보: {}",
+                lambda: json.dumps(token_info, indent=2, ensure_ascii=False))
             if "scopes" in token_info:
                 logger.info(f"✅ 현재 토큰에 부여된 권한(Scopes): {token_info['scopes']}")
                 if "talk_calendar" not in token_info["scopes"]:
@@ -126,21 +278,20 @@ class KakaoCalendarService:
 
     def get_upcoming_events(self, calendar_id: str = "primary", max_results: int = 10) -> List[Dict[str, Any]]:
         """다가오는 일정 조회"""
-        if not self.is_available():
+        if self._known_unavailable():
             logger.warning("카카오톡 캘린더 서비스를 사용할 수 없습니다.")
             return []
 
         try:
             # 카카오 API는 UTC 기준으로 시간을 처리합니다.
-            now_utc = datetime.utcnow()
-            time_min = now_utc.strftime('%Y-%m-%dT%H:%M:%SZ')
+            now_utc = datetime.now(timezone.utc)
+            time_min = _iso_utc(now_utc)
             # 'to' 파라미터는 'from'으로부터 최대 31일 이내로 설정해야 합니다.
-            time_max = (now_utc + timedelta(days=30)
-                        ).strftime('%Y-%m-%dT%H:%M:%SZ')
+            time_max = _iso_utc(now_utc + timedelta(days=30))
 
             response = self._request_with_retry(
                 "get",
-                f"{self.config.api_base_url}/v2/api/calendar/events",
+                self._events_url,
                 params={
                     "calendar_id": calendar_id,
                     "from": time_min,
@@ -148,18 +299,12 @@ class KakaoCalendarService:
                     "limit": max_results,
                 }
             )
-            events_data = response.json()
-
-            formatted_events = []
-            for event in events_data.get("events", []):
-                formatted_event = self._format_event(event)
-                if formatted_event:
-                    formatted_events.append(formatted_event)
+            formatted_events = self._format_events(json_loads(response.content))
 
             logger.info(f"다가오는 일정 {len(formatted_events)}개를 조회했습니다.")
             return formatted_events
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"카카오톡 캘린더 API 오류: {str(e)}")
             return []
         except Exception as e:
@@ -171,80 +316,83 @@ class KakaoCalendarService:
                      calendar_id: str = "primary", rrule: Optional[str] = None,
                      reminders: Optional[List[int]] = None, color: Optional[str] = None) -> Optional[str]:
         """새 일정 생성 (일반 일정)"""
-        if not self.is_available():
+        if self._known_unavailable():
             logger.warning("카카오톡 캘린더 서비스를 사용할 수 없습니다.")
             return None
 
         try:
-            # 카카오 API는 UTC 기준으로 시간을 처리합니다.
-            start_utc = start_time.astimezone().astimezone(pytz.utc)
-            end_utc = end_time.astimezone().astimezone(pytz.utc)
-
-            event_data = {
-                "title": title,
-                "time": {
-                    "start_at": start_utc.strftime('%Y-%m-%dT%H:%M:%SZ'),
-                    "end_at": end_utc.strftime('%Y-%m-%dT%H:%M:%SZ'),
-                    "time_zone": "Asia/Seoul",  # API 기본값이지만 명시적으로 설정
-                    "all_day": False,
-                    "lunar": False
-                },
-                "description": description,
-            }
-            if calendar_id != "primary":  # 기본 캘린더가 아니면 ID 명시
-                event_data["calendar_id"] = calendar_id
-
-            if location:  # location은 name, location_id, address, latitude, longitude 등을 포함하는 객체
-                event_data["location"] = location
-
-            if rrule:  # 반복 일정 설정 (RFC5545 RRULE 형식)
-                event_data["rrule"] = rrule
+            payload = {'event': json_dumps(self._build_event_data(
+                title, start_time, end_time, description, location,
+                calendar_id, rrule, reminders, color))}
 
-            if reminders:
-                event_data["reminders"] = reminders
-
-            if color:
-                event_data["color"] = color
-
-            payload = {'event': json.dumps(event_data)}
-
-            # 디버깅을 위해 전송 직전의 페이로드를 INFO 레벨로 강제 출력
-            logger.info(f"카카오 캘린더 생성 요청 데이터: {payload}")
+            # 전송 직전의 페이로드는 DEBUG 레벨에서만 포맷팅하여 출력 (위치 등 개인정보 포함)
+            logger.debug("카카오 캘린더 생성 요청 데이터: {}", payload)
 
             response = self._request_with_retry(
                 "post",
-                f"{self.config.api_base_url}/v2/api/calendar/create/event",
+                self._create_url,
                 data=payload
             )
-            event_result = response.json()
+            event_result = json_loads(response.content)
             event_id = event_result.get("event_id")
 
             logger.info(f"새 일정이 카카오톡 캘린더에 생성되었습니다: {title} (ID: {event_id})")
             return event_id
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"카카오톡 캘린더 API 오류: {str(e)}")
             return None
         except Exception as e:
             logger.error(f"일정 생성 중 오류 발생: {str(e)}")
             return None
 
+    @staticmethod
+    def _build_event_data(title: str, start_time: datetime, end_time: datetime,
+                          description: str = "", location: Dict[str, Any] = None,
+                          calendar_id: str = "primary", rrule: Optional[str] = None,
+                          reminders: Optional[List[int]] = None, color: Optional[str] = None) -> Dict[str, Any]:
+        """일정 생성 API에 보낼 event 객체를 구성합니다."""
+        # 카카오 API는 UTC 기준으로 시간을 처리합니다.
+        event_data = {
+            "title": title,
+            "time": {
+                "start_at": _to_kakao_utc(start_time),
+                "end_at": _to_kakao_utc(end_time),
+                **_EVENT_TIME_TEMPLATE,
+            },
+            "description": description,
+        }
+        if calendar_id != "primary":  # 기본 캘린더가 아니면 ID 명시
+            event_data["calendar_id"] = calendar_id
+
+        if location:  # location은 name, location_id, address, latitude, longitude 등을 포함하는 객체
+            event_data["location"] = location
+
+        if rrule:  # 반복 일정 설정 (RFC5545 RRULE 형식)
+            event_data["rrule"] = rrule
+
+        if reminders:
+            event_data["reminders"] = reminders
+
+        if color:
+            event_data["color"] = color
+
+        return event_data
+
     def get_events_in_range(self, start_date: datetime, end_date: datetime, calendar_id: str = "primary") -> List[Dict[str, Any]]:
         """특정 기간의 일정 조회"""
-        if not self.is_available():
+        if self._known_unavailable():
             logger.warning("카카오톡 캘린더 서비스를 사용할 수 없습니다.")
             return []
 
         try:
             # 시간 포맷팅 (RFC5545 UTC)
-            start_utc = start_date.astimezone().astimezone(pytz.utc)
-            end_utc = end_date.astimezone().astimezone(pytz.utc)
-            time_min = start_utc.strftime('%Y-%m-%dT%H:%M:%SZ')
-            time_max = end_utc.strftime('%Y-%m-%dT%H:%M:%SZ')
+            time_min = _to_kakao_utc(start_date)
+            time_max = _to_kakao_utc(end_date)
 
             response = self._request_with_retry(
                 "get",
-                f"{self.config.api_base_url}/v2/api/calendar/events",
+                self._events_url,
                 params={
                     "calendar_id": calendar_id,
                     "from": time_min,
@@ -252,24 +400,49 @@ class KakaoCalendarService:
                     # "limit": 1000 # 필요시 최대 결과 수 지정
                 }
             )
-            events_data = response.json()
-
-            formatted_events = []
-            for event in events_data.get("events", []):
-                formatted_event = self._format_event(event)
-                if formatted_event:
-                    formatted_events.append(formatted_event)
+            formatted_events = self._format_events(json_loads(response.content))
 
             logger.info(f"기간 내 일정 {len(formatted_events)}개를 조회했습니다.")
             return formatted_events
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"카카오톡 캘린더 API 오류: {str(e)}")
             return []
         except Exception as e:
             logger.error(f"기간별 일정 조회 중 오류 발생: {str(e)}")
             return []
 
+    @staticmethod
+    def _matches_query(event: Dict[str, Any], query_lower: str) -> bool:
+        """일정의 제목, 설명, 위치 중 하나라도 검색어(소문자)를 포함하는지 확인합니다."""
+        fields = (
+            event.get('title', ''),
+            event.get('description', ''),
+            str(event.get('location', '')),
+        )
+        return any(query_lower in field.lower() for field in fields)
+
+    @staticmethod
+    def _format_search_event(event: Dict[str, Any]) -> Dict[str, Any]:
+        """검색 결과용 일정 요약을 생성합니다."""
+        time_info = event.get('time', {})
+        return {
+            "id": event.get('id', ''),
+            "title": event.get('title', '제목 없음'),
+            "start_time": time_info.get('start_at', ''),
+            "end_time": time_info.get('end_at', ''),
+            "description": event.get('description', ''),
+        }
+
+    def _format_events(self, events_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """일정 목록 응답을 포맷팅하고, 변환할 수 없는 일정은 제외합니다."""
+        formatted_events = []
+        for event in events_data.get("events", []):
+            formatted_event = self._format_event(event)
+            if formatted_event:
+                formatted_events.append(formatted_event)
+        return formatted_events
+
     def _format_event(self, event_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """카카오톡 캘린더 일정 데이터 포맷팅"""
         try:
@@ -282,11 +455,9 @@ class KakaoCalendarService:
             if not start_at_str or not end_at_str:
                 return None
 
-            # UTC 문자열을 datetime 객체로 변환
-            start_time = datetime.fromisoformat(
-                start_at_str.replace('Z', '+00:00'))
-            end_time = datetime.fromisoformat(
-                end_at_str.replace('Z', '+00:00'))
+            # UTC 문자열을 datetime 객체로 변환 (Python 3.11부터 'Z' 접미사를 직접 지원)
+            start_time = datetime.fromisoformat(start_at_str)
+            end_time = datetime.fromisoformat(end_at_str)
 
             # location 정보 파싱
             location_info = event_data.get("location", {})
@@ -351,19 +522,18 @@ class KakaoCalendarService:
         # 예: destination_details = {'name': '카카오판교오피스', 'address': '경기 성남시 분당구 판교역로 166', 'latitude': 37.402056, 'longitude': 127.108212}
         kakao_location = None
         if destination_details:
+            x, y = destination_details.get("x"), destination_details.get("y")
             kakao_location = {
                 # 장소명
                 "name": destination_details.get("place_name", destination),
                 "address": destination_details.get("address_name", ""),  # 주소
                 # 카카오 캘린더 API는 위경도 직접 지원 여부 확인 필요, location_id가 있을 수 있음
                 "location_id": destination_details.get("id"),  # 카카오맵 장소 ID
-                "latitude": float(destination_details.get("y")) if destination_details.get("y") else None,
-                "longitude": float(destination_details.get("x")) if destination_details.get("x") else None,
             }
-            # 위경도 필드가 없는 경우 제거
-            if kakao_location["latitude"] is None or kakao_location["longitude"] is None:
-                kakao_location.pop("latitude", None)
-                kakao_location.pop("longitude", None)
+            # 위경도는 둘 다 있는 경우에만 추가
+            if x and y:
+                kakao_location["latitude"] = float(y)
+                kakao_location["longitude"] = float(x)
 
         return self.create_event(
             title=title,
@@ -383,16 +553,16 @@ class KakaoCalendarService:
         if not event_id:
             logger.error("일정 수정을 위한 event_id가 없습니다.")
             return False
+        if self._known_unavailable():
+            logger.warning("카카오톡 캘린더 서비스를 사용할 수 없습니다.")
+            return False
 
         try:
             event_data = {}
             if "start_time" in kwargs and "end_time" in kwargs:
-                start_utc = kwargs["start_time"].astimezone(
-                ).astimezone(pytz.utc)
-                end_utc = kwargs["end_time"].astimezone().astimezone(pytz.utc)
                 event_data["time"] = {
-                    "start_at": start_utc.strftime('%Y-%m-%dT%H:%M:%SZ'),
-                    "end_at": end_utc.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                    "start_at": _to_kakao_utc(kwargs["start_time"]),
+                    "end_at": _to_kakao_utc(kwargs["end_time"]),
                 }
 
             for key in ["title", "description", "location", "reminders", "color"]:
@@ -406,13 +576,13 @@ class KakaoCalendarService:
             payload = {
                 'event_id': event_id,
                 'calendar_id': calendar_id,
-                'event': json.dumps(event_data)
+                'event': json_dumps(event_data)
             }
-            logger.info(f"카카오 캘린더 수정 요청 데이터: {payload}")
+            logger.debug("카카오 캘린더 수정 요청 데이터: {}", payload)
 
             self._request_with_retry(
                 "post",
-                f"{self.config.api_base_url}/v2/api/calendar/update/event/host",
+                self._update_url,
                 data=payload
             )
 
@@ -431,11 +601,11 @@ class KakaoCalendarService:
 
         try:
             params = {'event_id': event_id}
-            logger.info(f"카카오 캘린더 삭제 요청: {params}")
+            logger.debug("카카오 캘린더 삭제 요청: {}", params)
 
             self._request_with_retry(
                 "delete",
-                f"{self.config.api_base_url}/v2/api/calendar/delete/event",
+                self._delete_url,
                 params=params
             )
 
@@ -459,14 +629,13 @@ class KakaoCalendarService:
         """
         try:
             # 카카오 API 제한사항에 맞춰 현재부터 30일 후까지만 조회
-            now_utc = datetime.utcnow()
-            time_min = now_utc.strftime('%Y-%m-%dT%H:%M:%SZ')
-            time_max = (now_utc + timedelta(days=30)
-                        ).strftime('%Y-%m-%dT%H:%M:%SZ')
+            now_utc = datetime.now(timezone.utc)
+            time_min = _iso_utc(now_utc)
+            time_max = _iso_utc(now_utc + timedelta(days=30))
 
             response = self._request_with_retry(
                 "get",
-                f"{self.config.api_base_url}/v2/api/calendar/events",
+                self._events_url,
                 params={
                     "calendar_id": "primary",
                     "from": time_min,
@@ -474,24 +643,14 @@ class KakaoCalendarService:
                     "limit": max_results * 2,  # 필터링 후 충분한 결과를 위해 2배로 설정
                 }
             )
-            events_data = response.json()
+            events_data = json_loads(response.content)
 
-            # 검색어로 필터링
+            # 검색어로 필터링 (제목, 설명, 위치 등에서 검색어 포함 여부 확인)
+            query_lower = query.lower()
             matched_events = []
             for event in events_data.get("events", []):
-                # 제목, 설명, 위치 등에서 검색어 포함 여부 확인
-                if (query.lower() in event.get('title', '').lower() or
-                    query.lower() in event.get('description', '').lower() or
-                        query.lower() in str(event.get('location', '')).lower()):
-
-                    formatted_event = {
-                        "id": event.get('id', ''),
-                        "title": event.get('title', '제목 없음'),
-                        "start_time": event.get('time', {}).get('start_at', ''),
-                        "end_time": event.get('time', {}).get('end_at', ''),
-                        "description": event.get('description', ''),
-                    }
-                    matched_events.append(formatted_event)
+                if self._matches_query(event, query_lower):
+                    matched_events.append(self._format_search_event(event))
 
                     # 최대 결과 수 제한
                     if len(matched_events) >= max_results:
@@ -519,22 +678,22 @@ class KakaoCalendarService:
         all_matched_events = []
 
         try:
-            now_utc = datetime.utcnow()
+            now_utc = datetime.now(timezone.utc)
 
             # 미래 일정 검색 (현재 ~ 30일 후)
             future_events = self.search_events(query, max_results)
             all_matched_events.extend(future_events)
+            seen_ids = {event['id'] for event in future_events}
 
             # 과거 일정 검색 (30일 전 ~ 현재)
             if include_past and len(all_matched_events) < max_results:
                 try:
-                    time_min = (now_utc - timedelta(days=30)
-                                ).strftime('%Y-%m-%dT%H:%M:%SZ')
-                    time_max = now_utc.strftime('%Y-%m-%dT%H:%M:%SZ')
+                    time_min = _iso_utc(now_utc - timedelta(days=30))
+                    time_max = _iso_utc(now_utc)
 
                     response = self._request_with_retry(
                         "get",
-                        f"{self.config.api_base_url}/v2/api/calendar/events",
+                        self._events_url,
                         params={
                             "calendar_id": "primary",
                             "from": time_min,
@@ -542,24 +701,18 @@ class KakaoCalendarService:
                             "limit": max_results * 2,
                         }
                     )
-                    events_data = response.json()
+                    events_data = json_loads(response.content)
 
+                    query_lower = query.lower()
                     for event in events_data.get("events", []):
-                        if (query.lower() in event.get('title', '').lower() or
-                            query.lower() in event.get('description', '').lower() or
-                                query.lower() in str(event.get('location', '')).lower()):
+                        if self._matches_query(event, query_lower):
 
                             # 중복 제거 (ID 기준)
                             event_id = event.get('id', '')
-                            if not any(e.get('id') == event_id for e in all_matched_events):
-                                formatted_event = {
-                                    "id": event_id,
-                                    "title": event.get('title', '제목 없음'),
-                                    "start_time": event.get('time', {}).get('start_at', ''),
-                                    "end_time": event.get('time', {}).get('end_at', ''),
-                                    "description": event.get('description', ''),
-                                }
-                                all_matched_events.append(formatted_event)
+                            if event_id not in seen_ids:
+                                seen_ids.add(event_id)
+                                all_matched_events.append(
+                                    self._format_search_event(event))
 
                                 if len(all_matched_events) >= max_results:
                                     break
@@ -579,5 +732,5 @@ class KakaoCalendarService:
             return []
 
 
-# 전역 Kakao Calendar 서비스 인스턴스 (나중에 설정 클래스에서 관리하도록 변경 가능)
-# kakao_calendar_service = KakaoCalendarService()
+# 전역 Kakao Calendar 서비스 인스턴스 (연결 풀을 프로세스 전체에서 공유)
+kakao_calendar_service = KakaoCalendarService()
@@ -8,34 +8,78 @@
 - 지도 정보
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import Any, Dict, List, NamedTuple, Optional
 
 import aiohttp
 
 from ..config.api_config import api_config
+from ..utils.json_utils import json_loads
 from ..utils.logger import logger
 
 
+class Place(NamedTuple):
+    """카카오맵 장소 검색 결과 한 건 (dict 대신 튜플로 보관하여 메모리를 줄입니다)"""
+    name: str
+    address: str
+    phone: str
+    category: str
+    x: float  # 경도
+    y: float  # 위도
+    place_url: str
+    distance: str
+
+
 class KakaoMapService:
     """카카오맵 API 서비스 클래스"""
 
     def __init__(self):
         self.base_url = "https://dapi.kakao.com"
+        # 호출마다 다시 만들지 않도록 API URL을 미리 구성합니다.
+        self._keyword_url = f"{self.base_url}/v2/local/search/keyword.json"
+        self._category_url = f"{self.base_url}/v2/local/search/category.json"
         self.api_key = api_config.kakao_rest_api_key
+        # API 키는 실행 중에 바뀌지 않으므로 한 번만 확인하고, 없으면 모든 검색을 건너뜁니다.
+        self._enabled = bool(self.api_key)
+        if not self._enabled:
+            logger.warning("카카오 API 키가 설정되지 않아 카카오맵 검색을 사용하지 않습니다.")
+        # 세션은 이벤트 루프에 묶이므로 첫 요청 시점에 생성하여 재사용합니다.
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def _get_headers(self) -> Dict[str, str]:
-        """API 요청 헤더 생성"""
-        if not self.api_key:
-            raise ValueError("카카오 REST API 키가 설정되지 않았습니다.")
+        """API 요청 헤더 생성 (API 키 확인은 __init__에서 수행)"""
         return {"Authorization": f"KakaoAK {self.api_key}"}
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """keep-alive 연결과 DNS 캐시를 재사용하는 세션을 반환합니다."""
+        loop = asyncio.get_running_loop()
+        if (self._session is None or self._session.closed
+                or self._session_loop is not loop):
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32, limit_per_host=16,
+                    ttl_dns_cache=300, keepalive_timeout=75),
+                headers=self._get_headers(),
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def aclose(self) -> None:
+        """열려 있는 HTTP 세션을 닫습니다."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
     async def search_places(
         self,
         query: str,
         location: Optional[str] = None,
         radius: int = 20000,
         limit: int = 15
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Place]:
         """
         키워드로 장소 검색
 
@@ -48,8 +92,7 @@ class KakaoMapService:
         Returns:
             장소 정보 리스트
         """
-        if not self.api_key:
-            logger.warning("카카오 API 키가 설정되지 않았습니다.")
+        if not self._enabled:
             return []
 
         try:
@@ -66,39 +109,22 @@ class KakaoMapService:
                     'radius': radius
                 })
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/v2/local/search/keyword.json",
-                    headers=self._get_headers(),
-                    params=params
-                ) as response:
-
-                    if response.status == 200:
-                        data = await response.json()
-                        # logger.info(f"카카오맵 API 응답 (query: '{query}'):\n{data}")
-                        places = []
-
-                        for item in data.get('documents', []):
-                            place_info = {
-                                'name': item.get('place_name', ''),
-                                'address': item.get(
-                                    'road_address_name', item.get(
-                                        'address_name', '')
-                                ),
-                                'phone': item.get('phone', ''),
-                                'category': item.get('category_name', ''),
-                                'x': float(item.get('x', 0)),  # 경도
-                                'y': float(item.get('y', 0)),  # 위도
-                                'place_url': item.get('place_url', ''),
-                                'distance': item.get('distance', '')
-                            }
-                            places.append(place_info)
-
-                        logger.info(f"카카오맵에서 '{query}' 검색 결과: {len(places)}개")
-                        return places
-                    else:
-                        logger.error(f"카카오맵 API 오류: {response.status}, 응답: {await response.text()}")
-                        return []
+            session = self._get_session()
+            async with session.get(
+                self._keyword_url,
+                params=params
+            ) as response:
+
+                if response.status == 200:
+                    data = await response.json(loads=json_loads)
+                    # logger.info(f"카카오맵 API 응답 (query: '{query}'):\n{data}")
+                    places = self._parse_places(data.get('documents', []))
+
+                    logger.info(f"카카오맵에서 '{query}' 검색 결과: {len(places)}개")
+                    return places
+                else:
+                    logger.error(f"카카오맵 API 오류: {response.status}, 응답: {await response.text()}")
+                    return []
 
         except Exception as e:
             logger.error(f"카카오맵 장소 검색 오류: {str(e)}")
@@ -111,7 +137,7 @@ class KakaoMapService:
         category: str = "FD6",
         radius: int = 1000,
         limit: int = 10
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Place]:
         """
         좌표 기반 주변 검색
 
@@ -125,7 +151,7 @@ class KakaoMapService:
         Returns:
             주변 장소 정보 리스트
         """
-        if not self.api_key:
+        if not self._enabled:
             return []
 
         try:
@@ -137,19 +163,18 @@ class KakaoMapService:
                 'size': limit
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/v2/local/search/category.json",
-                    headers=self._get_headers(),
-                    params=params
-                ) as response:
+            session = self._get_session()
+            async with session.get(
+                self._category_url,
+                params=params
+            ) as response:
 
-                    if response.status == 200:
-                        data = await response.json()
-                        return self._parse_places(data.get('documents', []))
-                    else:
-                        logger.error(f"카카오맵 주변 검색 오류: {response.status}")
-                        return []
+                if response.status == 200:
+                    data = await response.json(loads=json_loads)
+                    return self._parse_places(data.get('documents', []))
+                else:
+                    logger.error(f"카카오맵 주변 검색 오류: {response.status}")
+                    return []
 
         except Exception as e:
             logger.error(f"카카오맵 주변 검색 오류: {str(e)}")
@@ -183,24 +208,23 @@ class KakaoMapService:
             'status': 'not_implemented'
         }
 
-    def _parse_places(self, documents: List[Dict]) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _parse_places(documents: List[Dict]) -> List[Place]:
         """장소 정보 파싱 헬퍼 메서드"""
-        places = []
-        for item in documents:
-            place_info = {
-                'name': item.get('place_name', ''),
-                'address': item.get(
-                    'road_address_name', item.get('address_name', '')
-                ),
-                'phone': item.get('phone', ''),
-                'category': item.get('category_name', ''),
-                'x': float(item.get('x', 0)),
-                'y': float(item.get('y', 0)),
-                'place_url': item.get('place_url', ''),
-                'distance': item.get('distance', '')
-            }
-            places.append(place_info)
-        return places
+        return [
+            Place(
+                name=item.get('place_name', ''),
+                # 도로명 주소가 없으면 빈 문자열로 오므로 지번 주소로 대체
+                address=item.get('road_address_name') or item.get('address_name', ''),
+                phone=item.get('phone', ''),
+                category=item.get('category_name', ''),
+                x=float(item.get('x', 0)),
+                y=float(item.get('y', 0)),
+                place_url=item.get('place_url', ''),
+                distance=item.get('distance', ''),
+            )
+            for item in documents
+        ]
 
 
 # 전역 카카오맵 서비스 인스턴스
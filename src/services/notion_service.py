@@ -9,14 +9,40 @@ Notion API 연동 서비스
 """
 
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
 
+import httpx
 from notion_client import Client
 
+from ..utils.json_utils import json_loads
 from ..utils.logger import get_logger
+from ..utils.rate_limiter import RateLimiter
 
 logger = get_logger(__name__)
 
+# Notion API가 한 번의 쿼리로 반환하는 최대 페이지 수
+NOTION_MAX_PAGE_SIZE = 100
+
+# Notion 통합당 요청 한도(초당 3회)
+NOTION_REQUESTS_PER_SECOND = 3
+
+# 한도는 통합(API 키) 단위이므로, 모든 NotionService 인스턴스가 하나의 제한기를 공유합니다.
+_rate_limiter = RateLimiter(NOTION_REQUESTS_PER_SECOND, 1.0)
+
+
+class NotionPage(NamedTuple):
+    """Notion 데이터베이스 페이지 한 건 (dict 대신 튜플로 보관하여 메모리를 줄입니다)"""
+    id: str
+    title: str
+    url: str
+    created_time: str
+    last_edited_time: str
+
+
+def _use_fast_json(response: httpx.Response) -> None:
+    """응답 본문을 orjson 기반 json_loads로 파싱하도록 response.json을 교체합니다."""
+    response.json = lambda **kwargs: json_loads(response.content)
+
 
 class NotionService:
     """Notion API 서비스 클래스"""
@@ -37,6 +63,8 @@ class NotionService:
 
         # Notion 클라이언트 생성
         self.client = Client(auth=self.api_key)
+        # notion-client는 내부 httpx 클라이언트의 response.json()으로 응답을 파싱합니다.
+        self.client.client.event_hooks["response"].append(_use_fast_json)
 
     def get_database_info(self) -> Dict[str, Any]:
         """
@@ -56,7 +84,7 @@ class NotionService:
             logger.error(f"데이터베이스 정보 조회 중 오류: {e}")
             return {}
 
-    def query_database(self, filter_params: Optional[Dict] = None, max_results: int = 10) -> List[Dict[str, Any]]:
+    def query_database(self, filter_params: Optional[Dict] = None, max_results: int = 10) -> List[NotionPage]:
         """
         데이터베이스 쿼리
 
@@ -69,15 +97,24 @@ class NotionService:
         """
         try:
             query_params = {"database_id": self.database_id,
-                            "page_size": max_results}
+                            "page_size": min(max_results, NOTION_MAX_PAGE_SIZE)}
 
             if filter_params:
                 query_params["filter"] = filter_params
 
-            results = self.client.databases.query(**query_params)
+            # 한 번에 최대 100개까지만 반환되므로, 필요한 만큼만 커서로 이어서 조회합니다.
+            pages = []
+            while True:
+                results = self.client.databases.query(**query_params)
+                pages.extend(results['results'])
+                if len(pages) >= max_results or not results.get('has_more'):
+                    break
+                query_params["start_cursor"] = results['next_cursor']
+                query_params["page_size"] = min(
+                    max_results - len(pages), NOTION_MAX_PAGE_SIZE)
 
             formatted_results = []
-            for page in results['results']:
+            for page in pages[:max_results]:
                 formatted_page = self._format_page(page)
                 if formatted_page:
                     formatted_results.append(formatted_page)
@@ -123,7 +160,8 @@ class NotionService:
                     }
                 ]
 
-            new_page = self.client.pages.create(**page_data)
+            with _rate_limiter:
+                new_page = self.client.pages.create(**page_data)
             logger.info(f"새 페이지 생성 완료: {new_page['id']}")
             return new_page['id']
         except Exception as e:
@@ -173,7 +211,18 @@ class NotionService:
             logger.error(f"페이지 삭제 중 오류: {e}")
             return False
 
-    def _format_page(self, page: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    @staticmethod
+    def _extract_title(title_prop: Dict[str, Any]) -> str:
+        """title 속성(없으면 rich_text 속성)의 첫 텍스트를 제목으로 반환"""
+        texts = title_prop.get('title') or title_prop.get('rich_text')
+        if not texts:
+            return '제목 없음'
+        first = texts[0]
+        return (first.get('plain_text') or
+                first.get('text', {}).get('content') or
+                '제목 없음')
+
+    def _format_page(self, page: Dict[str, Any]) -> NotionPage:
         """
         Notion 페이지를 일관된 형식으로 변환
 
@@ -184,51 +233,25 @@ class NotionService:
             포맷팅된 페이지 정보
         """
         try:
-            # 다양한 제목 속성에 대응
-            title_prop = page['properties'].get('이름', {})
-            title = '제목 없음'
-
-            # title 속성이 있는 경우
-            if 'title' in title_prop:
-                titles = title_prop['title']
-                if titles and isinstance(titles, list) and len(titles) > 0:
-                    first_title = titles[0]
-                    if isinstance(first_title, dict):
-                        title = (
-                            first_title.get('plain_text') or
-                            first_title.get('text', {}).get('content') or
-                            '제목 없음'
-                        )
-
-            # rich_text 속성이 있는 경우 (백업)
-            elif 'rich_text' in title_prop:
-                rich_texts = title_prop['rich_text']
-                if rich_texts and isinstance(rich_texts, list) and len(rich_texts) > 0:
-                    first_text = rich_texts[0]
-                    if isinstance(first_text, dict):
-                        title = (
-                            first_text.get('plain_text') or
-                            first_text.get('text', {}).get('content') or
-                            '제목 없음'
-                        )
-
-            return {
-                "id": page['id'],
-                "title": title,
-                "url": page.get('url', ''),
-                "created_time": page.get('created_time', ''),
-                "last_edited_time": page.get('last_edited_time', '')
-            }
+            title = self._extract_title(page['properties'].get('이름', {}))
+
+            return NotionPage(
+                id=page['id'],
+                title=title,
+                url=page.get('url', ''),
+                created_time=page.get('created_time', ''),
+                last_edited_time=page.get('last_edited_time', ''),
+            )
         except Exception as e:
             logger.error(f"페이지 포맷팅 중 오류: {e}")
             # 오류 발생 시 기본 정보라도 반환
-            return {
-                "id": page.get('id', ''),
-                "title": "제목 없음",
-                "url": page.get('url', ''),
-                "created_time": page.get('created_time', ''),
-                "last_edited_time": page.get('last_edited_time', '')
-            }
+            return NotionPage(
+                id=page.get('id', ''),
+                title="제목 없음",
+                url=page.get('url', ''),
+                created_time=page.get('created_time', ''),
+                last_edited_time=page.get('last_edited_time', ''),
+            )
 
     def search_web(self, query: str, max_results: int = 5) -> Dict[str, Any]:
         """
@@ -260,8 +283,8 @@ class NotionService:
                 "query": query,
                 "results": [
                     {
-                        "title": result["title"],
-                        "url": result["url"],
+                        "title": result.title,
+                        "url": result.url,
                         "description": ""  # Notion은 기본적으로 설명 제공 안 함
                     } for result in results
                 ]
@@ -0,0 +1,11 @@
+"""
+웹 검색 서비스 공통 결과 타입
+"""
+from typing import NamedTuple
+
+
+class SearchResult(NamedTuple):
+    """검색 결과 한 건 (모든 검색 서비스가 공통으로 반환, dict 대신 튜플로 보관하여 메모리를 줄입니다)"""
+    title: str
+    url: str
+    description: str
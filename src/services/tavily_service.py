@@ -7,6 +7,7 @@ from typing import Any, Dict
 
 from tavily import TavilyClient
 
+from src.services.search_result import SearchResult
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -21,13 +22,13 @@ class TavilyService:
             raise ValueError("TAVILY_API_KEY 환경 변수가 설정되지 않았습니다.")
         self.client = TavilyClient(api_key=self.api_key)
 
-    def _format_result(self, result: Dict) -> Dict:
+    def _format_result(self, result: Dict) -> SearchResult:
         """Tavily 검색 결과를 일관된 형식으로 변환"""
-        return {
-            "title": result.get("title", ""),
-            "url": result.get("url", ""),
-            "description": result.get("content", ""),
-        }
+        return SearchResult(
+            result.get("title", ""),
+            result.get("url", ""),
+            result.get("content", ""),
+        )
 
     def search_web(
         self,
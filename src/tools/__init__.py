@@ -1,7 +1,8 @@
 # 현재 구현된 도구들만 import
 from .planner_tools import (create_travel_plan_tool, modify_travel_plan_tool,
                             validate_travel_plan_tool, web_search_tool)
-from .search_tools import location_search_tool, nearby_search_tool
+from .search_tools import (location_search_batch_tool, location_search_tool,
+                           nearby_search_tool)
 
 __all__ = [
     "create_travel_plan_tool",
@@ -9,5 +10,6 @@ __all__ = [
     "validate_travel_plan_tool",
     "web_search_tool",
     "location_search_tool",
+    "location_search_batch_tool",
     "nearby_search_tool",
 ]
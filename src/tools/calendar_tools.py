@@ -2,15 +2,62 @@
 
 import re
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 from langchain_core.tools import tool
 
-from src.services.kakao_calendar_service import KakaoCalendarService
+from src.services.kakao_calendar_service import \
+    kakao_calendar_service as calendar_service
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 여행 계획 텍스트 파싱에 사용하는 정규식 (모듈 로드 시 한 번만 컴파일)
+# 목적지 추출 (제목에서)
+_DEST_PATTERNS = [re.compile(pattern) for pattern in (
+    r'### (.+?) 여행',
+    r'## (.+?) 여행',
+    r'# (.+?) 여행',
+    r'(\w+(?:시|구|동|군|도)) (?:여행|투어|계획)',
+    r'(\w+) (?:여행|투어|계획)',
+)]
+# 날짜와 여행 기간 추출 (한 번의 스캔으로 모두 찾고, 이름 있는 그룹으로 종류를 구분)
+_DATE_DURATION_PATTERN = re.compile(
+    r'(?P<date_dash>\d{4}-\d{2}-\d{2})'
+    r'|(?P<date_dot>\d{4}\.\d{2}\.\d{2})'
+    r'|(?P<date_slash>\d{4}/\d{2}/\d{2})'
+    r'|(?P<nights>\d+)박\s*(?P<days>\d+)일'  # N박 M일
+    r'|(?P<day_ko>\d+)일차'
+    r'|Day\s*(?P<day_en>\d+)'
+)
+# 여러 날짜 형식이 섞여 있으면 이 순서대로 우선합니다.
+_DATE_GROUPS = ('date_dash', 'date_dot', 'date_slash')
+_DATE_SEPARATORS = str.maketrans('./', '--')
+# 시간별 일정 추출
+_ACTIVITY_PATTERNS = [re.compile(pattern, re.MULTILINE) for pattern in (
+    r'- \*\*(.+?)\*\*',  # **장소명**
+    r'- (.+?)(?:\n|$)',   # - 활동
+    r'(?:\d{1,2}:\d{2})\s*-\s*(.+?)(?:\n|$)',  # 시간 - 활동
+    r'#### (.+?)(?:\n|$)',  # #### 제목
+)]
+# 여행 계획에서 추출할 최대 활동 수
+MAX_ACTIVITIES = 10
+# 활동에서 제거할 주소/전화번호/링크 부분
+_ACTIVITY_STRIP = re.compile(r'주소:.*|전화번호:.*|링크:.*')
+
+
+def _parse_date(value: str) -> datetime:
+    """YYYY-MM-DD 날짜 문자열을 datetime으로 변환합니다.
+
+    대부분은 빠른 fromisoformat으로 처리하고, LLM이 만든 '2025-7-5'처럼
+    0을 채우지 않은 날짜는 strptime으로 처리합니다. 둘 다 실패하면 ValueError가 발생합니다.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.strptime(value, '%Y-%m-%d')
+
 
 @tool
 def add_travel_plan_to_calendar(
@@ -30,8 +77,6 @@ def add_travel_plan_to_calendar(
         캘린더 등록 결과 메시지
     """
     try:
-        calendar_service = KakaoCalendarService()
-
         # 여행 계획에서 정보 추출
         plan_info = _parse_travel_plan(travel_plan)
 
@@ -50,8 +95,7 @@ def add_travel_plan_to_calendar(
 
         # 날짜 파싱
         try:
-            start_datetime = datetime.strptime(
-                plan_info['start_date'], '%Y-%m-%d')
+            start_datetime = _parse_date(plan_info['start_date'])
         except ValueError:
             return "❌ 날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요."
 
@@ -94,8 +138,24 @@ def add_travel_plan_to_calendar(
         return f"❌ 캘린더 등록 중 오류가 발생했습니다: {str(e)}"
 
 
+@lru_cache(maxsize=64)
+def _analyze_travel_plan(travel_plan: str) -> Tuple[dict, Tuple[str, ...]]:
+    """여행 계획의 주요 정보와 활동 목록을 한 번만 추출하여 캐싱합니다.
+    (같은 계획으로 도구가 다시 호출되어도 텍스트를 다시 스캔하지 않음)"""
+    return _scan_plan_info(travel_plan), tuple(_scan_activities(travel_plan))
+
+
 def _parse_travel_plan(travel_plan: str) -> dict:
-    """여행 계획 텍스트에서 주요 정보를 추출합니다."""
+    """여행 계획 텍스트에서 주요 정보를 추출합니다. (수정해도 캐시에 영향이 없도록 복사본 반환)"""
+    return dict(_analyze_travel_plan(travel_plan)[0])
+
+
+def _extract_activities(travel_plan: str) -> list:
+    """여행 계획에서 활동/장소 목록을 추출합니다."""
+    return list(_analyze_travel_plan(travel_plan)[1])
+
+
+def _scan_plan_info(travel_plan: str) -> dict:
     info = {
         'destination': None,
         'start_date': None,
@@ -103,83 +163,52 @@ def _parse_travel_plan(travel_plan: str) -> dict:
     }
 
     # 목적지 추출 (제목에서)
-    destination_patterns = [
-        r'### (.+?) 여행',
-        r'## (.+?) 여행',
-        r'# (.+?) 여행',
-        r'(\w+(?:시|구|동|군|도)) (?:여행|투어|계획)',
-        r'(\w+) (?:여행|투어|계획)'
-    ]
-
-    for pattern in destination_patterns:
-        match = re.search(pattern, travel_plan)
+    for pattern in _DEST_PATTERNS:
+        match = pattern.search(travel_plan)
         if match:
             info['destination'] = match.group(1).strip()
             break
 
-    # 날짜 추출
-    date_patterns = [
-        r'(\d{4}-\d{2}-\d{2})',
-        r'(\d{4}\.\d{2}\.\d{2})',
-        r'(\d{4}/\d{2}/\d{2})'
-    ]
+    # 날짜 및 여행 기간 추출
+    first_dates = {}
+    max_day = 1
+    for match in _DATE_DURATION_PATTERN.finditer(travel_plan):
+        kind = match.lastgroup
+        if kind in _DATE_GROUPS:
+            first_dates.setdefault(kind, match.group(kind))
+        else:
+            # N박 M일 형태는 lastgroup이 'days'이므로 M일을 사용
+            max_day = max(max_day, int(match.group(kind)))
 
-    for pattern in date_patterns:
-        match = re.search(pattern, travel_plan)
-        if match:
-            date_str = match.group(1).replace('.', '-').replace('/', '-')
-            info['start_date'] = date_str
+    for kind in _DATE_GROUPS:
+        if kind in first_dates:
+            info['start_date'] = first_dates[kind].translate(_DATE_SEPARATORS)
             break
 
-    # 여행 기간 추출
-    duration_patterns = [
-        r'(\d+)박\s*(\d+)일',
-        r'(\d+)일차',
-        r'Day\s*(\d+)',
-        r'#### (\d+)일차'
-    ]
-
-    max_day = 1
-    for pattern in duration_patterns:
-        matches = re.findall(pattern, travel_plan)
-        for match in matches:
-            if isinstance(match, tuple):
-                # N박 M일 형태
-                if len(match) == 2:
-                    max_day = max(max_day, int(match[1]))
-                else:
-                    max_day = max(max_day, int(match[0]))
-            else:
-                max_day = max(max_day, int(match))
-
     info['duration'] = max_day
 
     return info
 
 
-def _extract_activities(travel_plan: str) -> list:
-    """여행 계획에서 활동/장소 목록을 추출합니다."""
+def _scan_activities(travel_plan: str) -> list:
     activities = []
+    seen = set()
 
-    # 시간별 일정 추출
-    time_patterns = [
-        r'- \*\*(.+?)\*\*',  # **장소명**
-        r'- (.+?)(?:\n|$)',   # - 활동
-        r'(?:\d{1,2}:\d{2})\s*-\s*(.+?)(?:\n|$)',  # 시간 - 활동
-        r'#### (.+?)(?:\n|$)'  # #### 제목
-    ]
-
-    for pattern in time_patterns:
-        matches = re.findall(pattern, travel_plan, re.MULTILINE)
-        for match in matches:
-            activity = match.strip()
+    # 시간별 일정 추출 (최대 MAX_ACTIVITIES개를 모으면 나머지는 스캔하지 않음)
+    for pattern in _ACTIVITY_PATTERNS:
+        for match in pattern.finditer(travel_plan):
+            activity = match.group(1).strip()
             if activity and len(activity) > 2:  # 너무 짧은 것은 제외
-                # 주소나 전화번호 부분 제거
-                activity = re.sub(r'주소:.*|전화번호:.*|링크:.*', '', activity).strip()
-                if activity and activity not in activities:
+                # 주소나 전화번호 부분 제거 (모든 키워드가 ':'로 끝나므로 ':'가 있을 때만 정규식 실행)
+                if ':' in activity:
+                    activity = _ACTIVITY_STRIP.sub('', activity).strip()
+                if activity and activity not in seen:
+                    seen.add(activity)
                     activities.append(activity)
+                    if len(activities) >= MAX_ACTIVITIES:
+                        return activities
 
-    return activities[:10]  # 최대 10개까지만
+    return activities
 
 
 @tool
@@ -194,28 +223,31 @@ def check_calendar_availability(date: str) -> str:
         해당 날짜의 일정 정보
     """
     try:
-        calendar_service = KakaoCalendarService()
-
         # 날짜 파싱
-        check_date = datetime.strptime(date, '%Y-%m-%d')
+        check_date = _parse_date(date)
         end_date = check_date + timedelta(days=1)
 
+        # 토큰이 유효하지 않으면 조회 결과가 비어 "일정 없음"으로 오인되므로 먼저 확인합니다.
+        # (확인 결과는 서비스에 반영되어 이어지는 일정 등록에서도 사용됩니다)
+        if not calendar_service.check_available():
+            return "❌ 카카오 캘린더에 연결할 수 없습니다. 카카오 토큰 설정을 확인해주세요."
+
         # 해당 날짜의 일정 조회
         events = calendar_service.get_events_in_range(check_date, end_date)
 
         if not events:
             return f"📅 {date}에는 등록된 일정이 없습니다."
 
-        result = f"📅 {date}의 일정:\n\n"
+        parts = [f"📅 {date}의 일정:\n\n"]
         for i, event in enumerate(events, 1):
-            result += f"{i}. {event.get('title', '제목 없음')}\n"
+            parts.append(f"{i}. {event.get('title', '제목 없음')}\n")
             if event.get('time'):
-                result += f"   ⏰ {event['time']}\n"
+                parts.append(f"   ⏰ {event['time']}\n")
             if event.get('location'):
-                result += f"   📍 {event['location']}\n"
-            result += "\n"
+                parts.append(f"   📍 {event['location']}\n")
+            parts.append("\n")
 
-        return result
+        return "".join(parts)
 
     except ValueError:
         return "❌ 날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식으로 입력해주세요."
@@ -246,8 +278,6 @@ def update_travel_plan_tool(
         수정 결과 메시지
     """
     try:
-        calendar_service = KakaoCalendarService()
-
         # 수정할 데이터 준비
         update_data = {}
         if title:
@@ -256,12 +286,12 @@ def update_travel_plan_tool(
         # 날짜 처리 - datetime 객체로 변환
         if start_date or end_date:
             if start_date:
-                start_datetime = datetime.strptime(
-                    start_date, '%Y-%m-%d').replace(hour=9, minute=0)  # 오전 9시로 설정
+                start_datetime = _parse_date(
+                    start_date).replace(hour=9, minute=0)  # 오전 9시로 설정
                 update_data['start_time'] = start_datetime
             if end_date:
-                end_datetime = datetime.strptime(
-                    end_date, '%Y-%m-%d').replace(hour=18, minute=0)  # 오후 6시로 설정
+                end_datetime = _parse_date(
+                    end_date).replace(hour=18, minute=0)  # 오후 6시로 설정
                 update_data['end_time'] = end_datetime
 
         if description:
@@ -292,8 +322,6 @@ def delete_travel_plan_tool(event_id: str) -> str:
         삭제 결과 메시지
     """
     try:
-        calendar_service = KakaoCalendarService()
-
         # 이벤트 삭제
         result = calendar_service.delete_event(event_id)
 
@@ -320,8 +348,6 @@ def search_travel_plan_tool(query: str, include_past: bool = False) -> str:
         검색된 일정 목록 문자열
     """
     try:
-        calendar_service = KakaoCalendarService()
-
         # 확장 검색 사용 (과거 일정 포함 옵션)
         events = calendar_service.search_events_extended(
             query, max_results=10, include_past=include_past)
@@ -332,18 +358,17 @@ def search_travel_plan_tool(query: str, include_past: bool = False) -> str:
 
         # 결과 포맷팅
         search_scope = "모든 일정" if include_past else "다가오는 일정"
-        result = f"'{query}'로 검색된 {search_scope}:\n\n"
-        for i, event in enumerate(events, 1):
-            result += (
-                f"{i}. **{event['title']}**\n"
-                f"   - 이벤트 ID: `{event['id']}`\n"
-                f"   - 시작: {event['start_time']}\n"
-                f"   - 종료: {event['end_time']}\n"
-                f"   - 설명: {event['description'] or '없음'}\n\n"
-            )
-
-        result += "💡 위 목록에서 수정하거나 삭제할 일정의 이벤트 ID를 복사하여 사용하세요."
-        return result
+        parts = [f"'{query}'로 검색된 {search_scope}:\n\n"]
+        parts.extend(
+            f"{i}. **{event['title']}**\n"
+            f"   - 이벤트 ID: `{event['id']}`\n"
+            f"   - 시작: {event['start_time']}\n"
+            f"   - 종료: {event['end_time']}\n"
+            f"   - 설명: {event['description'] or '없음'}\n\n"
+            for i, event in enumerate(events, 1)
+        )
+        parts.append("💡 위 목록에서 수정하거나 삭제할 일정의 이벤트 ID를 복사하여 사용하세요.")
+        return "".join(parts)
 
     except Exception as e:
         logger.error(f"여행 계획 검색 중 오류: {str(e)}")
@@ -2,18 +2,59 @@
 
 import json
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Dict, List
 
 from langchain_core.tools import tool
+from langchain_openai import OpenAIEmbeddings
 
+from src.config.settings import settings
 from src.services.duckduckgo_service import DuckDuckGoService
 from src.services.google_search_service import GoogleSearchService
 from src.services.tavily_service import TavilyService
+from src.utils.cache import TTLCache, normalize_query
+from src.utils.json_utils import json_dumps
+from src.utils.logger import get_logger
+from src.utils.semantic_cache import SemanticCache
+
+logger = get_logger(__name__)
 
 duckduckgo_service = DuckDuckGoService()
 google_search_service = GoogleSearchService()
 tavily_service = TavilyService()
 
+# 동일한 검색어에 대한 웹 검색 결과 캐시
+_web_search_cache = TTLCache(maxsize=2048, ttl=3600)
+
+
+# 매일 동일한 기본 일정 (바로 JSON으로 직렬화되므로 일자별로 새로 만들지 않고 공유합니다)
+_DAILY_ACTIVITIES = (
+    {"time": "12:00", "activity": "점심 식사", "location": "미정"},
+    {"time": "15:00", "activity": "관광 활동", "location": "미정"},
+    {"time": "18:00", "activity": "저녁 식사", "location": "미정"},
+    {"time": "21:00", "activity": "휴식", "location": "숙소"},
+)
+
+
+@lru_cache(maxsize=1)
+def _get_embeddings() -> OpenAIEmbeddings:
+    return OpenAIEmbeddings(model="text-embedding-3-small")
+
+
+# 표현만 다른 비슷한 검색어("제주 맛집 추천" / "제주도 맛집 추천해줘")도 재사용하는 의미 기반 캐시.
+# 다른 도시의 결과가 섞이지 않도록 목적지별로 따로 둡니다.
+_semantic_search_caches: Dict[str, SemanticCache] = {}
+
+
+def _get_semantic_search_cache(destination: str) -> SemanticCache:
+    key = normalize_query(destination)
+    cache = _semantic_search_caches.get(key)
+    if cache is None:
+        cache = _semantic_search_caches.setdefault(key, SemanticCache(
+            embed=lambda query: _get_embeddings().embed_query(query),
+            threshold=0.92, maxsize=128, ttl=3600))
+    return cache
+
 
 @tool
 def create_travel_plan_tool(
@@ -35,32 +76,30 @@ def create_travel_plan_tool(
     """
     try:
         # 기본 여행 계획 구조 생성
+        now = datetime.now()
+        start_date = now.date()
         travel_plan = {
             "destination": destination,
             "duration": duration,
             "theme": theme,
             "travelers": travelers,
-            "created_at": datetime.now().isoformat(),
-            "itinerary": []
+            "created_at": now.isoformat(),
+            # 일수별 기본 일정 틀 생성
+            "itinerary": [
+                {
+                    "day": day,
+                    "date": (start_date + timedelta(days=day - 1)).isoformat(),
+                    "activities": [
+                        {"time": "09:00", "activity": f"{destination} 여행 {day}일차 시작",
+                            "location": "숙소"},
+                        *_DAILY_ACTIVITIES,
+                    ]
+                }
+                for day in range(1, duration + 1)
+            ]
         }
 
-        # 일수별 기본 일정 틀 생성
-        for day in range(1, duration + 1):
-            day_plan = {
-                "day": day,
-                "date": (datetime.now() + timedelta(days=day-1)).strftime("%Y-%m-%d"),
-                "activities": [
-                    {"time": "09:00", "activity": f"{destination} 여행 {day}일차 시작",
-                        "location": "숙소"},
-                    {"time": "12:00", "activity": "점심 식사", "location": "미정"},
-                    {"time": "15:00", "activity": "관광 활동", "location": "미정"},
-                    {"time": "18:00", "activity": "저녁 식사", "location": "미정"},
-                    {"time": "21:00", "activity": "휴식", "location": "숙소"}
-                ]
-            }
-            travel_plan["itinerary"].append(day_plan)
-
-        return json.dumps(travel_plan, ensure_ascii=False, indent=2)
+        return json_dumps(travel_plan)
 
     except Exception as e:
         return f"여행 계획 생성 중 오류가 발생했습니다: {str(e)}"
@@ -82,7 +121,7 @@ def modify_travel_plan_tool(plan_json: str, modifications: str) -> str:
         plan["modified_at"] = datetime.now().isoformat()
         plan["modifications"] = modifications
 
-        return json.dumps(plan, ensure_ascii=False, indent=2)
+        return json_dumps(plan)
 
     except Exception as e:
         return f"여행 계획 수정 중 오류가 발생했습니다: {str(e)}"
@@ -122,26 +161,44 @@ def validate_travel_plan_tool(plan_json: str) -> str:
 
 
 @tool
-def web_search_tool(query: str) -> str:
+def web_search_tool(query: str, destination: str = "") -> str:
     """웹에서 정보를 검색하는 도구. 처음 초안 작성할때 사용하는 도구 입니다. 최종 계획 작성할때는 사용하지 마세요.
     Args:
         query:  질문
+        destination: 검색 대상 여행지 (예: "제주도")
 
     Returns:
         검색 결과 텍스트
     """
     try:
-        # Tavily Service를 사용하여 실제 웹 검색 수행
-        results = tavily_service.search_web(query, max_results=5)
+        # Tavily Service를 사용하여 실제 웹 검색 수행 (성공한 결과만 캐싱)
+        cache_key = normalize_query(query)
+        results = _web_search_cache.get(cache_key)
+        if results is None:
+            # 정확히 같은 검색어가 없으면 같은 목적지의 비슷한 검색어 결과를 찾습니다 (설정에서 켠 경우만)
+            semantic_cache = vector = None
+            if settings.semantic_search_cache and destination.strip():
+                semantic_cache = _get_semantic_search_cache(destination)
+                try:
+                    results, vector = semantic_cache.lookup(cache_key)
+                except Exception as e:
+                    logger.warning(f"검색어 임베딩 실패 (의미 기반 캐시 건너뜀): {e}")
+
+            if results is None:
+                results = tavily_service.search_web(query, max_results=5)
+                if results and results.get('success') and vector is not None:
+                    semantic_cache.set(cache_key, results, vector)
+            if results and results.get('success'):
+                _web_search_cache.set(cache_key, results)
 
         # 결과 포맷팅
         if results and results.get('success') and results.get('results'):
             formatted_results = []
             for i, result in enumerate(results['results'], 1):
                 formatted_results.append(
-                    f"{i}. {result.get('title', '')}\n"
-                    f"   URL: {result.get('url', '')}\n"
-                    f"   설명: {result.get('description', '')}\n"
+                    f"{i}. {result.title}\n"
+                    f"   URL: {result.url}\n"
+                    f"   설명: {result.description}\n"
                 )
             return f"'{query}' 검색 결과:\n\n" + "\n".join(formatted_results)
         else:
@@ -1,17 +1,134 @@
 # 검색 도구들
 
 import asyncio
+import functools
 import json
+import threading
+from typing import List
 
-from langchain_core.tools import tool
+from langchain_core.tools import StructuredTool
 
 from src.services.kakao_service import KakaoMapService
+from src.utils.cache import TTLCache, normalize_query
 
 kakao_map_service = KakaoMapService()
 
+# 카카오맵 HTTP 세션을 도구 호출 간에 재사용할 수 있도록,
+# 모든 비동기 검색은 하나의 백그라운드 이벤트 루프에서 실행합니다.
+_loop = asyncio.new_event_loop()
+threading.Thread(target=_loop.run_forever,
+                 name="kakao-map-loop", daemon=True).start()
 
-@tool
-def location_search_tool(query: str) -> str:
+
+def _run(coro):
+    """코루틴을 백그라운드 이벤트 루프에서 실행하고 결과를 기다립니다."""
+    return asyncio.run_coroutine_threadsafe(coro, _loop).result()
+
+
+async def _arun(coro):
+    """코루틴을 백그라운드 이벤트 루프에서 실행하고, 호출한 이벤트 루프를 막지 않고 결과를 기다립니다."""
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, _loop))
+
+
+def _loop_tool(coroutine_fn):
+    """
+    코루틴 함수를 동기(invoke)/비동기(ainvoke) 호출을 모두 지원하는 도구로 만듭니다.
+    어느 쪽으로 호출되든 본문은 백그라운드 이벤트 루프에서 실행되므로 카카오맵 세션이 하나로 유지됩니다.
+    """
+    @functools.wraps(coroutine_fn)
+    def func(*args, **kwargs):
+        return _run(coroutine_fn(*args, **kwargs))
+
+    @functools.wraps(coroutine_fn)
+    async def coroutine(*args, **kwargs):
+        return await _arun(coroutine_fn(*args, **kwargs))
+
+    return StructuredTool.from_function(func=func, coroutine=coroutine)
+
+# 장소 검색은 같은 입력에 같은 결과를 돌려주므로 정규화된 검색어 기준으로 캐싱합니다.
+_place_cache = TTLCache(maxsize=2048, ttl=3600)
+_nearby_cache = TTLCache(maxsize=2048, ttl=3600)
+# 캐시에 아직 없는 동일한 검색이 동시에 들어오면 하나의 API 호출을 공유합니다.
+# (모든 검색은 같은 백그라운드 루프에서 실행되므로 잠금이 필요 없습니다)
+_inflight = {}
+
+# 카테고리 한글명 매핑
+_CATEGORY_NAMES = {
+    "FD6": "음식점",
+    "CE7": "카페",
+    "AD5": "숙박시설",
+    "AT4": "관광명소"
+}
+
+
+async def _single_flight(key, make_coro):
+    """같은 key의 요청이 진행 중이면 그 결과를 기다리고, 없으면 새로 시작합니다."""
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(make_coro())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # 기다리던 호출 하나가 취소되어도 다른 호출이 공유하는 요청은 취소되지 않도록 보호합니다.
+    return await asyncio.shield(task)
+
+
+async def _search_places_cached(query: str, limit: int) -> list:
+    """카카오맵 장소 검색 결과를 캐시에서 찾고, 없으면 API를 호출합니다."""
+    key = (normalize_query(query), limit)
+    places = _place_cache.get(key)
+    if places is None:
+        places = await _single_flight(
+            ("place",) + key,
+            lambda: kakao_map_service.search_places(query, limit=limit))
+        if places:
+            _place_cache.set(key, places)
+    return places
+
+
+async def _search_nearby_cached(x: float, y: float, category: str, radius: int, limit: int) -> list:
+    """카카오맵 주변 검색 결과를 캐시에서 찾고, 없으면 API를 호출합니다."""
+    key = (x, y, category, radius, limit)
+    places = _nearby_cache.get(key)
+    if places is None:
+        places = await _single_flight(
+            ("nearby",) + key,
+            lambda: kakao_map_service.search_nearby(
+                x, y, category, radius, limit=limit))
+        if places:
+            _nearby_cache.set(key, places)
+    return places
+
+
+async def _search_around(location: str, category: str, radius: int):
+    """중심 위치를 찾은 뒤 이어서 주변 장소를 검색합니다. (이벤트 루프 왕복 한 번)"""
+    center_places = await _search_places_cached(location, limit=1)
+    if not center_places:
+        return None, []
+    center = center_places[0]
+    nearby_places = await _search_nearby_cached(
+        center.x, center.y, category, radius, limit=5)
+    return center, nearby_places
+
+
+def _format_place_result(query: str, places: list) -> str:
+    """장소 검색 결과 중 가장 관련성 높은 첫 번째 결과를 문자열로 변환합니다."""
+    if not places:
+        return f"'{query}'에 대한 검색 결과를 찾을 수 없습니다."
+
+    # 첫 번째 결과만 사용하여 가장 관련성 높은 정보 제공
+    place = places[0]
+    return (
+        f"'{query}' 검색 결과:\n"
+        f"- 이름: {place.name}\n"
+        f"- 주소: {place.address}\n"
+        f"- 전화번호: {place.phone}\n"
+        f"- 카테고리: {place.category}\n"
+        f"- 카카오맵 링크: {place.place_url}\n"
+    )
+
+
+@_loop_tool
+async def location_search_tool(query: str) -> str:
     """
     하나의 특정 장소에 대한 상세 정보를 카카오맵에서 검색합니다.
     이 도구는 '은혜손칼국수'나 '국립중앙박물관'처럼 검색하고 싶은 장소의 이름이 명확할 때 사용해야 합니다.
@@ -24,38 +141,46 @@ def location_search_tool(query: str) -> str:
         검색된 장소의 상세 정보 (주소, 전화번호, 카카오맵 링크 등)
     """
     try:
-        # 비동기 함수를 동기적으로 실행
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            # query 자체를 검색어로 사용하여 장소 검색
-            places = loop.run_until_complete(
-                kakao_map_service.search_places(query, limit=5)
-            )
-        finally:
-            loop.close()
-
-        if not places:
-            return f"'{query}'에 대한 검색 결과를 찾을 수 없습니다."
-
-        # 첫 번째 결과만 사용하여 가장 관련성 높은 정보 제공
-        place = places[0]
-        result = (
-            f"'{query}' 검색 결과:\n"
-            f"- 이름: {place.get('name', '')}\n"
-            f"- 주소: {place.get('address', '')}\n"
-            f"- 전화번호: {place.get('phone', '정보없음')}\n"
-            f"- 카테고리: {place.get('category', '')}\n"
-            f"- 카카오맵 링크: {place.get('place_url', '')}\n"
+        # query 자체를 검색어로 사용하여 장소 검색
+        places = await _search_places_cached(query, limit=5)
+
+        return _format_place_result(query, places)
+
+    except Exception as e:
+        return f"장소 검색 중 오류가 발생했습니다: {str(e)}"
+
+
+@_loop_tool
+async def location_search_batch_tool(queries: List[str]) -> str:
+    """
+    여러 장소의 상세 정보를 카카오맵에서 한 번에 검색합니다.
+    여행 계획 초안에 포함된 모든 장소 이름을 리스트로 전달하면, 동시에 검색하여 결과를 한꺼번에 반환합니다.
+
+    Args:
+        queries: 검색할 장소의 정확한 이름 목록 (예: ["일산 호수공원", "행주산성"])
+
+    Returns:
+        장소별 상세 정보 (주소, 전화번호, 카카오맵 링크 등)
+    """
+    if not queries:
+        return "검색할 장소가 없습니다."
+
+    try:
+        results = await asyncio.gather(
+            *(_search_places_cached(query, limit=5) for query in queries)
+        )
+
+        return "\n".join(
+            _format_place_result(query, places)
+            for query, places in zip(queries, results)
         )
-        return result
 
     except Exception as e:
         return f"장소 검색 중 오류가 발생했습니다: {str(e)}"
 
 
-@tool
-def nearby_search_tool(location: str, category: str = "FD6", radius: int = 1000) -> str:
+@_loop_tool
+async def nearby_search_tool(location: str, category: str = "FD6", radius: int = 1000) -> str:
     """특정 위치 주변의 장소를 검색하는 도구
 
     Args:
@@ -67,52 +192,29 @@ def nearby_search_tool(location: str, category: str = "FD6", radius: int = 1000)
         주변 장소 정보
     """
     try:
-        # 먼저 중심 위치의 좌표를 검색
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            center_places = loop.run_until_complete(
-                kakao_map_service.search_places(location, limit=1)
-            )
+        # 중심 위치의 좌표를 검색한 뒤 주변 장소 검색
+        center, nearby_places = await _search_around(location, category, radius)
 
-            if not center_places:
-                return f"{location}의 위치를 찾을 수 없습니다."
-
-            center = center_places[0]
-            x, y = center['x'], center['y']
-
-            # 주변 장소 검색
-            nearby_places = loop.run_until_complete(
-                kakao_map_service.search_nearby(
-                    x, y, category, radius, limit=5)
-            )
-        finally:
-            loop.close()
+        if center is None:
+            return f"{location}의 위치를 찾을 수 없습니다."
 
         if not nearby_places:
             return f"{location} 주변에서 해당 카테고리의 장소를 찾을 수 없습니다."
 
-        # 카테고리 한글명 매핑
-        category_names = {
-            "FD6": "음식점",
-            "CE7": "카페",
-            "AD5": "숙박시설",
-            "AT4": "관광명소"
-        }
-        category_name = category_names.get(category, category)
+        category_name = _CATEGORY_NAMES.get(category, category)
 
         # 결과 포맷팅
         formatted_results = []
         for i, place in enumerate(nearby_places, 1):
-            distance = place.get('distance', '')
+            distance = place.distance
             if distance:
                 distance = f" ({distance}m)"
 
             formatted_results.append(
-                f"{i}. {place.get('name', '')}{distance}\n"
-                f"   주소: {place.get('address', '')}\n"
-                f"   카테고리: {place.get('category', '')}\n"
-                f"   전화번호: {place.get('phone', '정보없음')}\n"
+                f"{i}. {place.name}{distance}\n"
+                f"   주소: {place.address}\n"
+                f"   카테고리: {place.category}\n"
+                f"   전화번호: {place.phone}\n"
             )
 
         return f"{location} 주변 {category_name} 검색 결과 (반경 {radius}m):\n\n" + "\n".join(formatted_results)
@@ -1,23 +1,47 @@
 """
 여행 계획 AI 어시스턴트 - 심플 채팅 인터페이스
 """
-import os
-import sys
-from datetime import datetime
-from pathlib import Path
+import time
+import uuid
+from datetime import datetime, timedelta
 
 import streamlit as st
 from dotenv import load_dotenv
 
-from src.core.multi_agent_system import TravelMultiAgentSystem
+from src.config.api_config import api_config
+from src.services.kakao_calendar_service import \
+    kakao_calendar_service as calendar_service
+from src.tools.calendar_tools import (add_travel_plan_to_calendar,
+                                      delete_travel_plan_tool,
+                                      update_travel_plan_tool)
+from src.utils.logger import get_logger
 
-# 프로젝트 루트 경로 추가
-project_root = Path(__file__).parent.parent.parent
-sys.path.append(str(project_root))
+logger = get_logger(__name__)
 
 
-# 환경 변수 로드
-load_dotenv(override=True)
+@st.cache_resource(show_spinner=False)
+def _bootstrap() -> bool:
+    """프로세스당 한 번만 실행하는 초기화 (스크립트는 rerun마다 다시 실행되므로 분리)
+
+    프로젝트 루트는 실행 위치(app.py가 루트로 이동 후 `python -m streamlit`으로 실행)로 이미 import 경로에 있습니다.
+    """
+    # 환경 변수 로드
+    load_dotenv(override=True)
+    return True
+
+
+_bootstrap()
+
+# 세션에 보관하고 다시 그리는 최대 채팅 메시지 수 (rerun마다 전체 기록을 다시 그리므로 제한)
+MAX_MESSAGES = 200
+# 항상 표시하는 최근 메시지 수 (그 이전 기록은 사용자가 펼칠 때만 그림)
+RECENT_MESSAGES = 20
+# 세션에 보관하는 최근 응답 시간 기록 수
+MAX_LATENCIES = 50
+# 스트리밍 중 화면을 갱신하는 최소 간격 (초) - 토큰마다 다시 그리지 않도록 묶어서 반영
+STREAM_FLUSH_INTERVAL = 0.05
+# 역할별 채팅 아바타
+MESSAGE_AVATARS = {"user": "👤", "assistant": "🤖"}
 
 # 페이지 설정
 st.set_page_config(
@@ -26,8 +50,8 @@ st.set_page_config(
     layout="centered"
 )
 
-# CSS 스타일
-st.markdown("""
+# CSS 스타일 - 스타일 전용 HTML은 st.html로 보내 매 rerun마다 markdown 파싱을 거치지 않습니다.
+PAGE_CSS = """
 <style>
     .main-title {
         text-align: center;
@@ -41,31 +65,6 @@ st.markdown("""
         font-size: 1.1rem;
         margin-bottom: 2rem;
     }
-    .user-message {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 15px 20px;
-        border-radius: 20px 20px 5px 20px;
-        margin: 10px 0;
-        max-width: 80%;
-        margin-left: auto;
-        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-    }
-    .ai-message {
-        background: #f8f9fa;
-        border: 1px solid #e9ecef;
-        padding: 15px 20px;
-        border-radius: 20px 20px 20px 5px;
-        margin: 10px 0;
-        max-width: 100%;
-        margin-right: auto;
-        box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-    }
-    .message-time {
-        font-size: 0.8rem;
-        opacity: 0.7;
-        margin-top: 5px;
-    }
     .stTextInput > div > div > input {
         border-radius: 25px;
         border: 2px solid #e9ecef;
@@ -80,42 +79,87 @@ st.markdown("""
         padding: 10px 30px;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.html(PAGE_CSS)
+
+
+def _fmt_date(value) -> str | None:
+    """날짜 입력값을 도구에 전달할 'YYYY-MM-DD' 문자열로 변환 (선택 입력이면 None)"""
+    return value.isoformat() if value else None
+
+
+def _now_hm() -> str:
+    """채팅 메시지에 표시할 현재 시각 ('HH:MM')"""
+    return datetime.now().strftime("%H:%M")
 
 
 def initialize_session_state():
     """세션 상태 초기화"""
     if "messages" not in st.session_state:
         st.session_state.messages = []
-    if "multi_agent_system" not in st.session_state:
-        st.session_state.multi_agent_system = None
+    if "thread_id" not in st.session_state:
+        # 시스템은 모든 세션이 공유하므로, 대화 기록은 세션별 thread_id로 구분합니다.
+        st.session_state.thread_id = uuid.uuid4().hex
+    if "calendar_forms" not in st.session_state:
+        # 메시지 id별 캘린더 등록 폼 표시 여부 (기록을 잘라내도 같은 메시지를 가리키도록 인덱스 대신 id 사용)
+        st.session_state.calendar_forms = {}
+    if "latencies" not in st.session_state:
+        # (첫 토큰까지 걸린 시간, 전체 응답 시간) 초 단위 기록
+        st.session_state.latencies = []
+
+
+@st.cache_resource(show_spinner="🤖 AI 에이전트 팀을 준비하고 있습니다...")
+def load_multi_agent_system():
+    """모든 세션이 공유하는 멀티 에이전트 시스템 (프로세스당 한 번만 생성)"""
+    # LangGraph/LangChain OpenAI 모듈은 첫 질문 때 불러와 첫 화면 표시를 늦추지 않습니다.
+    from src.core.multi_agent_system import TravelMultiAgentSystem
+
+    system = TravelMultiAgentSystem()
+    system.build_graph()
+    return system
+
+
+def reset_conversation():
+    """대화 초기화 - 새 thread_id로 시작하고 이전 대화의 체크포인트를 삭제합니다.
+
+    시스템은 모든 세션이 공유하므로, thread_id를 그대로 두면 에이전트가 이전 대화를 계속 이어받습니다.
+    """
+    old_thread_id = st.session_state.thread_id
+    had_messages = bool(st.session_state.messages)
+    st.session_state.messages = []
+    st.session_state.calendar_forms = {}
+    st.session_state.thread_id = uuid.uuid4().hex
+    if had_messages:
+        # 대화를 나눈 적이 있으면 시스템이 이미 로드되어 있으므로 새로 생성하지 않습니다.
+        try:
+            load_multi_agent_system().checkpointer.delete_thread(old_thread_id)
+        except Exception as e:
+            logger.warning(f"이전 대화 체크포인트 삭제 실패: {e}")
 
 
 def get_multi_agent_system():
     """멀티 에이전트 시스템 가져오기 (캐싱)"""
-    if st.session_state.multi_agent_system is None:
-        try:
-            # API 키 확인
-            if not os.getenv("OPENAI_API_KEY"):
-                st.error("⚠️ OpenAI API 키가 설정되지 않았습니다.")
-                st.stop()
-
-            # 시스템 초기화
-            with st.spinner("🤖 AI 에이전트 팀을 준비하고 있습니다..."):
-                system = TravelMultiAgentSystem()
-                system.build_graph()
-                st.session_state.multi_agent_system = system
+    # API 키 확인 - 환경 변수는 api_config가 임포트될 때 한 번만 읽습니다.
+    if not api_config.openai_api_key:
+        st.error("⚠️ OpenAI API 키가 설정되지 않았습니다.")
+        st.stop()
 
-        except Exception as e:
-            st.error(f"❌ 시스템 초기화 실패: {str(e)}")
-            st.stop()
+    try:
+        # 시스템 초기화 (실패한 경우는 캐싱되지 않으므로 다음 실행에서 다시 시도)
+        return load_multi_agent_system()
+    except Exception as e:
+        st.error(f"❌ 시스템 초기화 실패: {str(e)}")
+        st.stop()
 
-    return st.session_state.multi_agent_system
 
+def display_chat_messages(pending: bool = False):
+    """채팅 메시지 표시
 
-def display_chat_messages():
-    """채팅 메시지 표시"""
+    pending이 True이면 이어서 새 입력을 처리하므로 안내 문구와 이전 응답의 캘린더 버튼을 생략합니다.
+    """
     if not st.session_state.messages:
+        if pending:
+            return
         st.markdown("""
         <div style="text-align: center; color: #888; padding: 50px; font-style: italic;">
             💬 안녕하세요! 여행 계획에 대해 무엇이든 물어보세요.<br><br>
@@ -124,62 +168,81 @@ def display_chat_messages():
         """, unsafe_allow_html=True)
         return
 
-    # 메시지 표시
-    for i, message in enumerate(st.session_state.messages):
-        if message["role"] == "user":
-            st.markdown(f"""
-            <div class="user-message">
-                <strong>👤 You</strong><br>
-                {message["content"]}
-                <div class="message-time">{message["timestamp"]}</div>
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            st.markdown(f"""
-            <div class="ai-message">
-                <strong>🤖 Travel Planner </strong><br>
-                {message["content"]}
-                <div class="message-time">{message["timestamp"]}</div>
-            </div>
-            """, unsafe_allow_html=True)
+    # 메시지 표시 - 이전 기록은 토글을 켰을 때만 그려 rerun 비용을 일정하게 유지합니다.
+    # (st.expander는 접혀 있어도 내용을 매번 실행하므로 토글로 분기)
+    messages = st.session_state.messages
+    start = max(len(messages) - RECENT_MESSAGES, 0)
+    if start and st.toggle(f"이전 대화 {start}개 보기", key="show_older_messages"):
+        start = 0
+
+    for message in messages[start:-1]:
+        render_message(message)
+
+    # 캘린더 버튼은 최신 메시지만 확인합니다. 새 입력을 처리할 차례라면 새 응답에만 표시합니다.
+    render_message(messages[-1], show_actions=not pending)
+
+
+def _render_message_body(message: dict, show_actions: bool = False):
+    """채팅 메시지 내용과 시각 표시 (st.chat_message 컨테이너 안에서 호출)"""
+    st.markdown(message["content"])
+    st.caption(message["timestamp"])
+
+    # AI 응답에 캘린더 등록 버튼 추가 (최신 메시지에만)
+    if show_actions and message["role"] == "assistant" and "여행" in message["content"]:
+        add_calendar_button(message["content"], message["id"])
+
+
+def render_message(message: dict, show_actions: bool = False):
+    """채팅 메시지 하나를 표시"""
+    with st.chat_message(message["role"], avatar=MESSAGE_AVATARS[message["role"]]):
+        _render_message_body(message, show_actions)
+
+
+def _set_calendar_form(message_id: str, visible: bool):
+    """캘린더 등록 폼 표시 여부 변경 (버튼 on_click 콜백)"""
+    if visible:
+        st.session_state.calendar_forms[message_id] = True
+    else:
+        st.session_state.calendar_forms.pop(message_id, None)
 
-            # AI 응답에 캘린더 등록 버튼 추가 (최신 메시지에만)
-            if i == len(st.session_state.messages) - 1 and "여행" in message["content"]:
-                add_calendar_button(message["content"], i)
 
+@st.fragment
+def add_calendar_button(travel_plan: str, message_id: str):
+    """캘린더 등록 버튼과 날짜 입력 UI 추가
 
-def add_calendar_button(travel_plan: str, message_index: int):
-    """캘린더 등록 버튼과 날짜 입력 UI 추가"""
+    날짜 입력이나 취소 버튼을 조작할 때 이 영역만 다시 실행되므로, 채팅 기록과 사이드바는 다시 그리지 않습니다.
+    """
     st.markdown("---")
 
     col1, col2 = st.columns([1, 3])
 
     with col1:
-        if st.button("📅 캘린더에 등록", key=f"calendar_btn_{message_index}"):
-            st.session_state[f"show_calendar_form_{message_index}"] = True
+        st.button("📅 캘린더에 등록", key=f"calendar_btn_{message_id}",
+                  on_click=_set_calendar_form, args=(message_id, True))
 
     with col2:
-        if st.button("🔄 새로운 계획 요청", key=f"new_plan_btn_{message_index}"):
+        if st.button("🔄 새로운 계획 요청", key=f"new_plan_btn_{message_id}"):
             # 입력창으로 포커스 이동 (새로운 요청 유도)
-            # 새 계획을 위해 메시지 기록 초기화. 이것만으로도 rerun이 트리거됩니다.
-            st.session_state.messages = []
+            # 새 계획을 위해 대화 초기화. 채팅 기록은 fragment 밖에 있으므로 전체를 다시 실행합니다.
+            reset_conversation()
+            st.rerun()
 
     # 캘린더 등록 폼 표시
-    if st.session_state.get(f"show_calendar_form_{message_index}", False):
+    if st.session_state.calendar_forms.get(message_id):
         with st.expander("📅 캘린더 등록 정보 입력", expanded=True):
             col1, col2 = st.columns(2)
 
             with col1:
                 start_date = st.date_input(
                     "여행 시작 날짜",
-                    key=f"start_date_{message_index}",
+                    key=f"start_date_{message_id}",
                     help="여행을 시작할 날짜를 선택해주세요"
                 )
 
             with col2:
                 destination = st.text_input(
                     "여행 목적지",
-                    key=f"destination_{message_index}",
+                    key=f"destination_{message_id}",
                     placeholder="예: 서울, 부산, 제주도",
                     help="여행 목적지를 입력해주세요"
                 )
@@ -187,31 +250,26 @@ def add_calendar_button(travel_plan: str, message_index: int):
             col1, col2, col3 = st.columns([1, 1, 2])
 
             with col1:
-                if st.button("✅ 등록", key=f"confirm_calendar_{message_index}"):
+                if st.button("✅ 등록", key=f"confirm_calendar_{message_id}"):
                     register_to_calendar(
-                        travel_plan, start_date, destination, message_index)
+                        travel_plan, start_date, destination, message_id)
 
             with col2:
-                if st.button("❌ 취소", key=f"cancel_calendar_{message_index}"):
-                    st.session_state[f"show_calendar_form_{message_index}"] = False
-                    # 상태 변경 후 자동 rerun 됩니다.
+                # 콜백에서 상태를 바꾸므로 다음 실행에서 바로 폼이 사라집니다.
+                st.button("❌ 취소", key=f"cancel_calendar_{message_id}",
+                          on_click=_set_calendar_form, args=(message_id, False))
 
 
-def register_to_calendar(travel_plan: str, start_date, destination: str, message_index: int):
+def register_to_calendar(travel_plan: str, start_date, destination: str, message_id: str):
     """캘린더에 여행 계획 등록"""
     try:
-        from src.tools.calendar_tools import add_travel_plan_to_calendar
-
-        # 날짜를 문자열로 변환
-        start_date_str = start_date.strftime(
-            '%Y-%m-%d') if start_date else None
-
         # 캘린더 등록 도구 호출
         result = add_travel_plan_to_calendar(
             travel_plan=travel_plan,
-            start_date=start_date_str,
+            start_date=_fmt_date(start_date),
             destination=destination
         )
+        _fetch_events.clear()
 
         # 결과 표시
         if "✅" in result:
@@ -220,8 +278,7 @@ def register_to_calendar(travel_plan: str, start_date, destination: str, message
             st.error(result)
 
         # 폼 숨기기
-        st.session_state[f"show_calendar_form_{message_index}"] = False
-        # 상태 변경 후 자동 rerun 됩니다.
+        _set_calendar_form(message_id, False)
 
     except Exception as e:
         st.error(f"❌ 캘린더 등록 중 오류가 발생했습니다: {str(e)}")
@@ -232,49 +289,155 @@ def process_user_input(user_input: str):
     if not user_input.strip():
         return
 
-    # 사용자 메시지 추가
-    timestamp = datetime.now().strftime("%H:%M")
-    st.session_state.messages.append({
+    # 사용자 메시지 추가 - rerun 없이 바로 이어서 표시합니다.
+    timestamp = _now_hm()
+    user_message = {
+        "id": uuid.uuid4().hex,
         "role": "user",
         "content": user_input,
         "timestamp": timestamp
-    })
+    }
+    st.session_state.messages.append(user_message)
+    render_message(user_message)
 
     # AI 응답 생성
     try:
         system = get_multi_agent_system()
 
-        # 로딩 상태 표시
-        with st.spinner("🤖 AI 에이전트들이 최적의 여행 계획을 준비하고 있습니다..."):
-            # 멀티 에이전트 시스템 실행
+        # 로딩 상태 표시 - 답변은 assistant 채팅 컨테이너 안에서 스트리밍합니다.
+        assistant_box = st.chat_message("assistant", avatar=MESSAGE_AVATARS["assistant"])
+        response_placeholder = assistant_box.empty()
+        with assistant_box, st.spinner("🤖 AI 에이전트들이 최적의 여행 계획을 준비하고 있습니다..."):
+            # 멀티 에이전트 시스템 실행 - Supervisor의 답변을 생성되는 대로 표시
             full_response = ""
-            for chunk in system.stream(user_input):
-                # 각 단계의 응답을 수집
-                for node_name, node_data in chunk.items():
-                    if "messages" in node_data and node_data["messages"]:
-                        last_message = node_data["messages"][-1]
-                        if hasattr(last_message, 'content'):
-                            full_response = last_message.content
+            current_message_id = None
+            started = time.perf_counter()
+            first_token = None
+            last_flush = 0.0
+            config = {"configurable": {"thread_id": st.session_state.thread_id}}
+            for message_id, token in system.stream_response(user_input, config):
+                if first_token is None:
+                    first_token = time.perf_counter() - started
+                # Supervisor가 새 메시지를 시작하면 최종 답변만 남도록 이전 내용을 지웁니다.
+                if message_id != current_message_id:
+                    current_message_id = message_id
+                    full_response = ""
+                full_response += token
+                now = time.monotonic()
+                if now - last_flush >= STREAM_FLUSH_INTERVAL:
+                    response_placeholder.markdown(full_response + "▌")
+                    last_flush = now
 
             # 최종 응답이 없는 경우 기본 메시지
             if not full_response:
                 full_response = "죄송합니다. 응답을 생성하는데 문제가 발생했습니다."
 
+        # 응답 시간 기록 - 최적화 대상을 판단하기 위해 첫 토큰/전체 시간을 남깁니다.
+        total = time.perf_counter() - started
+        latencies = st.session_state.latencies
+        latencies.append((first_token, total))
+        del latencies[:-MAX_LATENCIES]
+        logger.info(f"응답 완료: 첫 토큰 {first_token or 0:.2f}초, 전체 {total:.2f}초")
+
         # AI 응답 추가
-        ai_timestamp = datetime.now().strftime("%H:%M")
-        st.session_state.messages.append({
+        ai_timestamp = _now_hm()
+        ai_message = {
+            "id": uuid.uuid4().hex,
             "role": "assistant",
             "content": full_response,
             "timestamp": ai_timestamp
-        })
+        }
+        st.session_state.messages.append(ai_message)
+        if len(st.session_state.messages) > MAX_MESSAGES:
+            del st.session_state.messages[:-MAX_MESSAGES]
 
-        # 강제로 페이지 새로고침
-        st.rerun()
+        # 스트리밍하던 자리에 최종 응답을 그려, 페이지를 다시 실행하지 않습니다.
+        with response_placeholder.container():
+            _render_message_body(ai_message, show_actions=True)
 
     except Exception as e:
         st.error(f"❌ 오류가 발생했습니다: {str(e)}")
-        # 강제로 페이지 새로고침
-        st.rerun()
+
+
+# 일정 조회 결과를 재사용하는 시간 (초)
+EVENTS_CACHE_TTL = 60
+# 일정 조회 기간 (일)
+EVENTS_LOOKAHEAD_DAYS = 30
+
+
+@st.cache_data(ttl=EVENTS_CACHE_TTL, show_spinner=False)
+def _fetch_events(start: datetime, end: datetime) -> list:
+    """기간 내 카카오 캘린더 일정 조회 (반복 클릭 시 API를 다시 호출하지 않음)"""
+    return calendar_service.get_events_in_range(start, end)
+
+
+@st.fragment
+def render_calendar_manager():
+    """캘린더 이벤트 관리 섹션
+
+    입력 위젯을 조작할 때 이 섹션만 다시 실행되므로, 채팅 기록 전체를 다시 그리지 않습니다.
+    """
+    st.header("📅 캘린더 이벤트 관리")
+
+    # 이벤트 조회
+    if st.button("📋 내 일정 조회", use_container_width=True):
+        try:
+            # 분 단위로 맞춰 같은 분 안의 반복 조회는 캐시를 사용합니다.
+            now = datetime.now().replace(second=0, microsecond=0)
+            events = _fetch_events(
+                now,
+                now + timedelta(days=EVENTS_LOOKAHEAD_DAYS)
+            )
+
+            if events:
+                # 일정 목록은 하나의 markdown 요소로 묶어 한 번에 표시합니다.
+                st.markdown("### 다가오는 일정\n\n" + "\n\n".join(
+                    f"**{event.get('title', '제목 없음')}**\n"
+                    f"- 시작: {event.get('start_time', '정보 없음')}\n"
+                    f"- 종료: {event.get('end_time', '정보 없음')}\n"
+                    f"- 이벤트 ID: `{event.get('id', '정보 없음')}`"
+                    for event in events
+                ))
+            else:
+                st.info("조회된 일정이 없습니다.")
+        except Exception as e:
+            st.error(f"일정 조회 중 오류: {e}")
+
+    # 이벤트 수정
+    st.subheader("🔧 일정 수정")
+    update_event_id = st.text_input("수정할 이벤트 ID", key="update_event_id")
+    update_title = st.text_input("새 제목 (선택)", key="update_title")
+    update_start_date = st.date_input(
+        "새 시작 날짜 (선택)", key="update_start_date")
+    update_end_date = st.date_input("새 종료 날짜 (선택)", key="update_end_date")
+    update_description = st.text_area(
+        "새 설명 (선택)", key="update_description")
+
+    if st.button("✏️ 일정 수정", use_container_width=True):
+        try:
+            result = update_travel_plan_tool(
+                event_id=update_event_id,
+                title=update_title or None,
+                start_date=_fmt_date(update_start_date),
+                end_date=_fmt_date(update_end_date),
+                description=update_description or None
+            )
+            _fetch_events.clear()
+            st.success(result)
+        except Exception as e:
+            st.error(f"일정 수정 중 오류: {e}")
+
+    # 이벤트 삭제
+    st.subheader("🗑️ 일정 삭제")
+    delete_event_id = st.text_input("삭제할 이벤트 ID", key="delete_event_id")
+
+    if st.button("❌ 일정 삭제", use_container_width=True):
+        try:
+            result = delete_travel_plan_tool(event_id=delete_event_id)
+            _fetch_events.clear()
+            st.success(result)
+        except Exception as e:
+            st.error(f"일정 삭제 중 오류: {e}")
 
 
 def main():
@@ -286,113 +449,45 @@ def main():
 
     initialize_session_state()
 
-    # AI 에이전트 시스템 로드
-    system = get_multi_agent_system()
-    if not system:
-        st.stop()
+    # AI 에이전트 시스템은 첫 질문을 처리할 때 로드합니다 (process_user_input).
+    # 캘린더 관리만 사용하는 동안에는 그래프 생성 비용이 들지 않습니다.
 
     # --- 사이드바 ---
     with st.sidebar:
         st.header("⚙️ 옵션")
+        if st.session_state.latencies:
+            first_token, total = st.session_state.latencies[-1]
+            average = sum(t for _, t in st.session_state.latencies) / len(st.session_state.latencies)
+            st.caption(f"⏱️ 최근 응답: 첫 토큰 {first_token or 0:.1f}초 / 전체 {total:.1f}초 "
+                       f"(최근 {len(st.session_state.latencies)}회 평균 {average:.1f}초)")
         if st.button("🗑️ 채팅 기록 초기화", use_container_width=True):
-            st.session_state.messages = []
+            reset_conversation()
             # st.rerun() # 불필요, 버튼 클릭 시 자동 rerun
 
-        # 예시 질문 추가
+        # 예시 질문 추가 - 클릭한 질문은 메인 채팅 영역에서 처리합니다.
         st.header("💡 예시 질문")
         if st.button("서울 2박 3일 여행", use_container_width=True):
-            process_user_input("서울 2박 3일 여행 계획 짜줘")
+            st.session_state.pending_prompt = "서울 2박 3일 여행 계획 짜줘"
 
         if st.button("부산 맛집 투어", use_container_width=True):
-            process_user_input("부산 맛집 투어 일정 추천해줘")
+            st.session_state.pending_prompt = "부산 맛집 투어 일정 추천해줘"
 
         if st.button("제주도 가족 여행", use_container_width=True):
-            process_user_input("제주도 가족 여행 계획 세워줘")
+            st.session_state.pending_prompt = "제주도 가족 여행 계획 세워줘"
 
         # 캘린더 이벤트 관리 섹션 추가
-        st.header("📅 캘린더 이벤트 관리")
-
-        # 이벤트 조회
-        if st.button("📋 내 일정 조회", use_container_width=True):
-            try:
-                from datetime import datetime, timedelta
-
-                from src.services.kakao_calendar_service import \
-                    KakaoCalendarService
-
-                calendar_service = KakaoCalendarService()
-                now = datetime.now()
-                events = calendar_service.get_events_in_range(
-                    now,
-                    now + timedelta(days=30)
-                )
-
-                if events:
-                    st.write("### 다가오는 일정")
-                    for event in events:
-                        st.markdown(f"""
-                        **{event.get('title', '제목 없음')}**
-                        - 시작: {event.get('start_time', '정보 없음')}
-                        - 종료: {event.get('end_time', '정보 없음')}
-                        - 이벤트 ID: `{event.get('id', '정보 없음')}`
-                        """)
-                else:
-                    st.info("조회된 일정이 없습니다.")
-            except Exception as e:
-                st.error(f"일정 조회 중 오류: {e}")
-
-        # 이벤트 수정
-        st.subheader("🔧 일정 수정")
-        update_event_id = st.text_input("수정할 이벤트 ID", key="update_event_id")
-        update_title = st.text_input("새 제목 (선택)", key="update_title")
-        update_start_date = st.date_input(
-            "새 시작 날짜 (선택)", key="update_start_date")
-        update_end_date = st.date_input("새 종료 날짜 (선택)", key="update_end_date")
-        update_description = st.text_area(
-            "새 설명 (선택)", key="update_description")
-
-        if st.button("✏️ 일정 수정", use_container_width=True):
-            try:
-                from src.tools.calendar_tools import update_travel_plan_tool
-
-                # 날짜를 문자열로 변환 (선택적)
-                start_date_str = update_start_date.strftime(
-                    '%Y-%m-%d') if update_start_date else None
-                end_date_str = update_end_date.strftime(
-                    '%Y-%m-%d') if update_end_date else None
-
-                result = update_travel_plan_tool(
-                    event_id=update_event_id,
-                    title=update_title or None,
-                    start_date=start_date_str,
-                    end_date=end_date_str,
-                    description=update_description or None
-                )
-                st.success(result)
-            except Exception as e:
-                st.error(f"일정 수정 중 오류: {e}")
-
-        # 이벤트 삭제
-        st.subheader("🗑️ 일정 삭제")
-        delete_event_id = st.text_input("삭제할 이벤트 ID", key="delete_event_id")
-
-        if st.button("❌ 일정 삭제", use_container_width=True):
-            try:
-                from src.tools.calendar_tools import delete_travel_plan_tool
-
-                result = delete_travel_plan_tool(event_id=delete_event_id)
-                st.success(result)
-            except Exception as e:
-                st.error(f"일정 삭제 중 오류: {e}")
+        render_calendar_manager()
 
     # --- 메인 채팅 인터페이스 ---
-    display_chat_messages()
+    # chat_input은 호출 위치와 관계없이 화면 하단에 고정되므로 먼저 읽어 둡니다.
+    user_input = st.chat_input("여행 계획을 입력해주세요...")
+    prompt = user_input or st.session_state.pop("pending_prompt", None)
+
+    display_chat_messages(pending=bool(prompt))
 
-    # 사용자 입력 처리
-    if user_input := st.chat_input("여행 계획을 입력해주세요..."):
-        process_user_input(user_input)
-        # process_user_input 실행 후 자동으로 rerun되어 메시지가 표시됩니다.
-        # 따라서 여기서는 아무것도 할 필요가 없습니다.
+    # 새 입력은 기록 아래에 바로 이어서 그리므로 st.rerun()이 필요 없습니다.
+    if prompt:
+        process_user_input(prompt)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,22 @@
+"""
+Fast JSON helpers that use orjson when it is installed.
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib decoder/encoder
+    orjson = None
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document from bytes or str."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize ``obj`` to a compact JSON string (non-ASCII kept as-is)."""
+    if orjson:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
@@ -13,6 +13,9 @@ def setup_logger():
     # Remove default handler
     logger.remove()
 
+    # Full variable dumps in tracebacks are only worth their cost when debugging
+    debug = settings.log_level.upper() == "DEBUG"
+
     # Add console handler
     logger.add(
         sys.stdout,
@@ -22,7 +25,11 @@ def setup_logger():
                "<cyan>{line}</cyan> | "
                "<level>{message}</level>",
         level=settings.log_level,
-        colorize=True
+        colorize=True,
+        # Hand records to a background thread so callers never block on I/O
+        enqueue=True,
+        backtrace=debug,
+        diagnose=debug
     )
 
     # Add file handler for errors
@@ -33,7 +40,8 @@ def setup_logger():
         level="ERROR",
         rotation="10 MB",
         retention="30 days",
-        compression="zip"
+        compression="zip",
+        enqueue=True
     )
 
     return logger
@@ -0,0 +1,38 @@
+"""
+Token-bucket rate limiting for APIs with per-second request quotas.
+"""
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing ``rate`` calls per ``per`` seconds."""
+
+    def __init__(self, rate: int, per: float = 1.0):
+        self.capacity = rate
+        self._fill_rate = rate / per
+        self._tokens = float(rate)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated_at) * self._fill_rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._fill_rate
+            time.sleep(wait)
+
+    def __enter__(self) -> "RateLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
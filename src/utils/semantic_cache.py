@@ -0,0 +1,81 @@
+"""
+Embedding-based cache that also serves near-duplicate queries.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class SemanticCache:
+    """Thread-safe LRU cache keyed by query embeddings.
+
+    A lookup hits when the cosine similarity between the query and a cached
+    query is at least ``threshold``, so rephrasings such as "best restaurants
+    Jeju" and "top restaurants in Jeju" share one entry.
+    """
+
+    def __init__(self, embed: Callable[[str], Sequence[float]],
+                 threshold: float = 0.92, maxsize: int = 512, ttl: float = 3600):
+        self._embed = embed
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple[float, np.ndarray, Any]]" = OrderedDict()
+        # Stacked embeddings of ``_entries``, rebuilt lazily after a change.
+        self._keys: list = []
+        self._matrix: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+
+    def embed(self, query: str) -> np.ndarray:
+        """Return the L2-normalized embedding of ``query``."""
+        vector = np.asarray(self._embed(query), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, query: str) -> Tuple[Any, np.ndarray]:
+        """Return ``(value, embedding)``; ``value`` is None on a miss.
+
+        Pass the embedding back to :meth:`set` to avoid embedding twice.
+        """
+        vector = self.embed(query)
+        with self._lock:
+            if not self._entries:
+                return None, vector
+            if self._matrix is None:
+                self._keys = list(self._entries)
+                self._matrix = np.vstack([self._entries[key][1] for key in self._keys])
+            scores = self._matrix @ vector
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None, vector
+            key = self._keys[best]
+            expires_at, _, value = self._entries[key]
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self._matrix = None
+                return None, vector
+            self._entries.move_to_end(key)
+            return value, vector
+
+    def set(self, query: str, value: Any, vector: Optional[np.ndarray] = None) -> None:
+        """Store ``value`` for ``query``, evicting the least recently used entry."""
+        if vector is None:
+            vector = self.embed(query)
+        with self._lock:
+            self._entries[query] = (time.monotonic() + self.ttl, vector, value)
+            self._entries.move_to_end(query)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            self._matrix = None
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._matrix = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
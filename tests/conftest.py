@@ -0,0 +1,11 @@
+"""
+Shared pytest setup.
+
+Service singletons validate their API keys at import time, so dummy values are
+provided before any ``src`` module is imported. Tests never reach the real APIs.
+"""
+import os
+
+for _key in ("OPENAI_API_KEY", "TAVILY_API_KEY", "NOTION_API_KEY", "NOTION_DATABASE_ID",
+             "GOOGLE_SEARCH_API_KEY", "GOOGLE_SEARCH_CX", "KAKAO_REST_API_KEY"):
+    os.environ.setdefault(_key, "test")
@@ -0,0 +1,37 @@
+"""
+Date parsing tests for the calendar tools.
+"""
+from datetime import datetime
+
+import pytest
+
+from src.tools import calendar_tools
+from src.tools.calendar_tools import _parse_date, update_travel_plan_tool
+
+
+@pytest.mark.parametrize("value", ["2025-07-05", "2025-7-5", "2025-07-5", "2025-7-05"])
+def test_parse_date_accepts_padded_and_unpadded_dates(value):
+    assert _parse_date(value) == datetime(2025, 7, 5)
+
+
+@pytest.mark.parametrize("value", ["2025/07/05", "07-05-2025", "2025-13-01", ""])
+def test_parse_date_rejects_other_formats(value):
+    with pytest.raises(ValueError):
+        _parse_date(value)
+
+
+def test_update_tool_parses_unpadded_dates(monkeypatch):
+    updates = {}
+
+    def update_event(event_id, **kwargs):
+        updates.update(kwargs)
+        return True
+
+    monkeypatch.setattr(calendar_tools.calendar_service, "update_event", update_event)
+
+    result = update_travel_plan_tool.invoke(
+        {"event_id": "evt", "start_date": "2025-7-5", "end_date": "2025-7-7"})
+
+    assert result.startswith("✅")
+    assert updates == {"start_time": datetime(2025, 7, 5, 9, 0),
+                       "end_time": datetime(2025, 7, 7, 18, 0)}
@@ -0,0 +1,41 @@
+"""
+Availability guard tests for KakaoCalendarService against a mocked Kakao API.
+"""
+import httpx
+import pytest
+
+from src.services import kakao_calendar_service
+from src.services.kakao_calendar_service import KakaoCalendarService
+
+
+@pytest.fixture
+def kakao_api(monkeypatch):
+    """Serve the Kakao API from a handler; ``state["status"]`` sets every response code."""
+    monkeypatch.setenv("KAKAO_ACCESS_TOKEN", "token")
+    monkeypatch.setattr(KakaoCalendarService, "_prewarm_started", True)
+    state = {"status": 503, "requests": []}
+
+    def handler(request):
+        state["requests"].append(request.url.path)
+        return httpx.Response(state["status"], json={"events": []})
+
+    service = KakaoCalendarService(persist_token=False)
+    service._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return service, state
+
+
+def test_failed_check_blocks_calls_only_within_ttl(kakao_api, monkeypatch):
+    service, state = kakao_api
+    clock = [1000.0]
+    monkeypatch.setattr(kakao_calendar_service.time, "monotonic", lambda: clock[0])
+
+    assert service.check_available() is False
+    assert service.get_upcoming_events() == []
+    assert len(state["requests"]) == 1
+
+    # The backend recovers; once the verdict expires the lookup reaches the API again.
+    state["status"] = 200
+    clock[0] += kakao_calendar_service.AVAILABILITY_CHECK_TTL
+    assert service.get_upcoming_events() == []
+    assert state["requests"][-1].endswith("/calendar/events")
+    assert service.check_available() is True
@@ -0,0 +1,147 @@
+"""
+End-to-end handoff tests for TravelMultiAgentSystem with a scripted chat model.
+"""
+import itertools
+import json
+
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import (AIMessage, AIMessageChunk, HumanMessage,
+                                     ToolMessage)
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from src.core.multi_agent_system import (HANDOFF_TOOL_NAME, WORKER_DESCRIPTIONS,
+                                         TravelMultiAgentSystem)
+from src.prompts.agent_prompts import AgentPrompts
+
+AGENT_BY_PROMPT = {
+    AgentPrompts.get_system_message(name).content: name
+    for name in ("supervisor", *WORKER_DESCRIPTIONS)
+}
+
+
+class ScriptedChatModel(BaseChatModel):
+    """The supervisor hands the user's turn to ``handoffs``; workers just report back."""
+
+    handoffs: list = []
+    calls: list = []
+    ids: itertools.count = itertools.count()
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        return ChatResult(generations=[ChatGeneration(message=self._reply(messages))])
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        # Like ChatOpenAI, emit chunks so stream_mode="messages" yields AIMessageChunk
+        message = self._reply(messages)
+        yield ChatGenerationChunk(message=AIMessageChunk(
+            content=message.content, tool_call_chunks=[
+                {"name": call["name"], "args": json.dumps(call["args"]),
+                 "id": call["id"], "index": index}
+                for index, call in enumerate(message.tool_calls)
+            ]))
+
+    def _reply(self, messages) -> AIMessage:
+        agent = AGENT_BY_PROMPT[messages[0].content]
+        self.calls.append(agent)
+        if agent != "supervisor":
+            message = AIMessage(content=f"{agent} done")
+        elif isinstance(messages[-1], HumanMessage):
+            message = AIMessage(content="", tool_calls=[
+                {"name": HANDOFF_TOOL_NAME, "args": {"agent": name},
+                 "id": f"call_{next(self.ids)}"}
+                for name in self.handoffs
+            ])
+        else:
+            message = AIMessage(content="final answer")
+        return message
+
+
+def _make_system(handoffs):
+    system = TravelMultiAgentSystem()
+    system.llm = ScriptedChatModel(handoffs=handoffs)
+    system.build_graph()
+    return system
+
+
+def _run_turn(system, user_input, thread_id="test"):
+    config = {"configurable": {"thread_id": thread_id}}
+    for _ in system.stream(user_input, config):
+        pass
+    return system.app.get_state(config).values["messages"]
+
+
+def _assert_every_tool_call_answered(messages):
+    answered = {m.tool_call_id for m in messages if isinstance(m, ToolMessage)}
+    for message in messages:
+        if isinstance(message, AIMessage):
+            assert {call["id"] for call in message.tool_calls} <= answered
+
+
+@pytest.mark.filterwarnings("ignore")
+def test_two_handoffs_run_both_workers():
+    system = _make_system(["share_agent", "calendar_agent"])
+
+    messages = _run_turn(system, "노션 공유하고 캘린더 등록해줘")
+
+    calls = system.llm.calls
+    assert calls[0] == "supervisor" and calls[-1] == "supervisor"
+    assert sorted(calls[1:-1]) == ["calendar_agent", "share_agent"]
+    _assert_every_tool_call_answered(messages)
+    assert [m.content for m in messages if isinstance(m, ToolMessage)] == [
+        "Successfully transferred to share_agent",
+        "Successfully transferred to calendar_agent",
+    ]
+    assert messages[-1].content == "final answer"
+
+
+@pytest.mark.filterwarnings("ignore")
+def test_single_handoff_keeps_history_valid_across_turns():
+    system = _make_system(["planner_agent"])
+
+    _run_turn(system, "서울 2박 3일 여행 계획 짜줘")
+    messages = _run_turn(system, "부산으로 바꿔줘")
+
+    assert system.llm.calls == ["supervisor", "planner_agent", "supervisor"] * 2
+    _assert_every_tool_call_answered(messages)
+    assert sum(isinstance(m, HumanMessage) for m in messages) == 2
+    assert messages[-1].content == "final answer"
+
+
+@pytest.mark.filterwarnings("ignore")
+def test_stream_response_yields_supervisor_answer():
+    system = _make_system(["share_agent", "calendar_agent"])
+    config = {"configurable": {"thread_id": "stream"}}
+
+    answer = "".join(token for _, token in system.stream_response("공유해줘", config))
+
+    assert answer == "final answer"
+
+
+@pytest.mark.filterwarnings("ignore")
+def test_checkpointer_keeps_only_root_namespace():
+    system = _make_system(["share_agent", "calendar_agent"])
+
+    for turn in range(3):
+        _run_turn(system, f"질문 {turn}")
+
+    assert list(system.checkpointer.storage["test"]) == [""]
+    assert {ns for _, ns, *_ in system.checkpointer.blobs} == {""}
+
+
+@pytest.mark.filterwarnings("ignore")
+def test_checkpointer_evicts_least_recently_used_threads():
+    system = _make_system(["planner_agent"])
+    system.checkpointer.max_threads = 2
+
+    for thread_id in ("a", "b", "a", "c"):
+        _run_turn(system, "서울 여행", thread_id=thread_id)
+
+    assert set(system.checkpointer.storage) == {"a", "c"}
+    assert not system.app.get_state({"configurable": {"thread_id": "b"}}).values